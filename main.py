@@ -1,25 +1,68 @@
 """Main entry point for Trip.com Flight Scraper."""
 
 import asyncio
+import logging
+import logging.handlers
+import queue
+import sys
 import colorama
 
-from src.api.server import start_server
+try:
+    import uvloop
+except ImportError:  # Not available on Windows; use the stock event loop
+    uvloop = None
 
-# Initialize colorama
-colorama.init(autoreset=True)
+from src.api.server import console_colors, start_server
+from src.config import LOG_LEVEL
 
+# Initialize colorama only for terminals; its stream wrapper scans every write
+if sys.stdout.isatty():
+    colorama.init(autoreset=True)
 
-async def main():
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create the server's event loop, on uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def setup_logging() -> logging.handlers.QueueListener:
+    """
+    Route log records through a queue so the event loop never blocks writing to stdout.
+
+    Returns:
+        The started listener; stop it on shutdown to flush pending records
+    """
+    log_queue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s"))
+
+    # QueueHandler pre-renders the message (and any traceback); the listener adds the layout
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=LOG_LEVEL, handlers=[queue_handler])
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
+
+
+def main():
     """Application entry point."""
     try:
-        await start_server()
-    except KeyboardInterrupt:
-        print(f"\n{colorama.Fore.YELLOW}[*] Shutting down gracefully...{colorama.Fore.WHITE}")
+        start_server(loop=new_event_loop())
     except Exception as e:
-        print(f"{colorama.Fore.RED}[!] Fatal error: {e}{colorama.Fore.WHITE}")
+        fore = console_colors()
+        print(f"{fore.RED}[!] Fatal error: {e}{fore.WHITE}")
         import traceback
         traceback.print_exc()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    log_listener = setup_logging()
+    try:
+        main()
+    finally:
+        log_listener.stop()
@@ -1,13 +1,62 @@
 """HTTP request handlers for API endpoints."""
 
-import json
 import asyncio
+import logging
+import traceback
 from aiohttp import web
 
 from src.core.token_generator import TokenGenerator
 from src.core.browser_manager import BrowserManager
 from src.services.flight_scraper import FlightScraper
 from src.services.browser_response_interceptor import BrowserResponseInterceptor
+from src.utils import json_utils
+from src.config import DEBUG, SERVER_MAX_REQUEST_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+def json_response(data, status: int = 200) -> web.Response:
+    """
+    Build a JSON response, encoding the body with orjson when available.
+    
+    Args:
+        data: JSON-serializable response payload
+        status: HTTP status code (default: 200)
+        
+    Returns:
+        aiohttp response with an application/json body
+    """
+    return web.Response(body=json_utils.dumps(data), status=status, content_type='application/json')
+
+
+async def read_json(request):
+    """
+    Read and parse the JSON request body, with orjson when available.
+    
+    Args:
+        request: aiohttp request object
+        
+    Returns:
+        The decoded request body
+        
+    Raises:
+        web.HTTPRequestEntityTooLarge: If the declared body size exceeds SERVER_MAX_REQUEST_SIZE
+    """
+    # Refuse oversized bodies from the header alone, before buffering them
+    if request.content_length is not None and request.content_length > SERVER_MAX_REQUEST_SIZE:
+        raise web.HTTPRequestEntityTooLarge(
+            max_size=SERVER_MAX_REQUEST_SIZE,
+            actual_size=request.content_length
+        )
+    return json_utils.loads(await request.read())
+
+
+def too_large_response(e: web.HTTPRequestEntityTooLarge) -> web.Response:
+    """Build the JSON error response for an oversized request body."""
+    return json_response({
+        "status": "error",
+        "error": e.text
+    }, status=413)
 
 
 async def handle_sign(request):
@@ -21,25 +70,26 @@ async def handle_sign(request):
         JSON response with generated tokens or error message
     """
     try:
-        data = await request.json()
-        print(f"[*] Received token generation request")
+        data = await read_json(request)
+        logger.info("Received token generation request")
 
         # Initialize token generator
-        generator = TokenGenerator()
+        generator = TokenGenerator(request.app['browser_pool'])
         
         # Generate all tokens
         result = await generator.generate_tokens(data)
         
-        return web.json_response({
+        return json_response({
             "status": "success",
             **result
         })
 
+    except web.HTTPRequestEntityTooLarge as e:
+        return too_large_response(e)
+
     except Exception as e:
-        import traceback
-        print(f"[!] Error in handle_sign: {e}")
-        print(traceback.format_exc())
-        return web.json_response({
+        logger.exception("Error in handle_sign: %s", e)
+        return json_response({
             "status": "error",
             "error": str(e)
         }, status=500)
@@ -61,34 +111,37 @@ async def handle_scrape(request):
         JSON response with flight data or error message
     """
     try:
-        data = await request.json()
+        data = await read_json(request)
         url = data.get('url')
         
         if not url:
-            return web.json_response({
+            return json_response({
                 "status": "error",
                 "error": "URL is required"
             }, status=400)
         
-        print(f"[*] Received scrape request for URL: {url}")
+        logger.info("Received scrape request for URL: %s", url)
         
         # Initialize scraper
-        scraper = FlightScraper()
+        scraper = FlightScraper(request.app['browser_pool'], request.app['http_session'])
         
         # Scrape flights
         result = await scraper.scrape_flights(url)
         
-        return web.json_response(result)
+        return json_response(result)
+    
+    except web.HTTPRequestEntityTooLarge as e:
+        return too_large_response(e)
     
     except Exception as e:
-        import traceback
-        print(f"[!] Error in handle_scrape: {e}")
-        print(traceback.format_exc())
-        return web.json_response({
+        logger.exception("Error in handle_scrape: %s", e)
+        body = {
             "status": "error",
-            "error": str(e),
-            "traceback": traceback.format_exc()
-        }, status=500)
+            "error": str(e)
+        }
+        if DEBUG:
+            body["traceback"] = traceback.format_exc()
+        return json_response(body, status=500)
 
 
 async def handle_scrape_browser(request):
@@ -112,55 +165,58 @@ async def handle_scrape_browser(request):
     browser_manager = None
     
     try:
-        data = await request.json()
+        data = await read_json(request)
         url = data.get('url')
         
         if not url:
-            return web.json_response({
+            return json_response({
                 "status": "error",
                 "error": "URL is required"
             }, status=400)
         
-        print(f"[*] Received scrape-browser request for URL: {url}")
+        logger.info("Received scrape-browser request for URL: %s", url)
         
         # Initialize browser manager
-        print(f"[*] Initializing browser...")
-        browser_manager = BrowserManager()
+        logger.info("Opening browser tab...")
+        browser_manager = BrowserManager(request.app['browser_pool'])
         await browser_manager.create_session()
         
         # Initialize interceptor
         interceptor = BrowserResponseInterceptor(browser_manager)
         
         # Intercept response (increased timeout for SSE responses)
-        print(f"[*] Opening URL and intercepting FlightListSearchSSE response...")
+        logger.info("Opening URL and intercepting FlightListSearchSSE response...")
         result = await interceptor.intercept_flight_search_response(url, timeout=90)
         
-        print(f"[+] Successfully intercepted flight data")
-        return web.json_response(result)
+        logger.info("Successfully intercepted flight data")
+        return json_response(result)
+        
+    except web.HTTPRequestEntityTooLarge as e:
+        return too_large_response(e)
         
     except TimeoutError as e:
-        print(f"[!] Timeout error: {e}")
-        return web.json_response({
+        logger.warning("Timeout error: %s", e)
+        return json_response({
             "status": "error",
             "error": str(e),
             "message": "FlightListSearchSSE response was not captured within timeout period"
         }, status=408)
         
     except Exception as e:
-        import traceback
-        print(f"[!] Error in handle_scrape_browser: {e}")
-        print(traceback.format_exc())
-        return web.json_response({
+        logger.exception("Error in handle_scrape_browser: %s", e)
+        body = {
             "status": "error",
-            "error": str(e),
-            "traceback": traceback.format_exc()
-        }, status=500)
+            "error": str(e)
+        }
+        if DEBUG:
+            body["traceback"] = traceback.format_exc()
+        return json_response(body, status=500)
         
     finally:
-        # Clean up browser
+        # Clean up browser tab
         if browser_manager:
             try:
                 await browser_manager.close()
-                print(f"[*] Browser closed")
+                logger.info("Browser tab closed")
             except Exception as e:
-                print(f"[!] Error closing browser: {e}")
+                logger.warning("Error closing browser: %s", e)
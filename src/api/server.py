@@ -1,39 +1,136 @@
 """HTTP server initialization and configuration."""
 
 import asyncio
+import socket
+import sys
+from types import SimpleNamespace
+from typing import Optional
+
+import aiohttp
 from aiohttp import web
-import colorama
 
 from src.api.handlers import handle_sign, handle_scrape, handle_scrape_browser
-from src.config import SERVER_HOST, SERVER_PORT
+from src.config import (
+    SERVER_HOST,
+    SERVER_PORT,
+    SERVER_BACKLOG,
+    SERVER_SEND_BUFFER_SIZE,
+    SERVER_NODELAY_MAX_BODY,
+    SERVER_MAX_REQUEST_SIZE,
+)
+from src.core.browser_manager import BrowserPool
+
+
+def console_colors():
+    """Return colorama's `Fore`, or blank colours off a terminal or without colorama."""
+    blank = SimpleNamespace(CYAN='', GREEN='', YELLOW='', WHITE='', RED='')
+    # Off a terminal colorama is not initialised, so its codes would reach pipes and log files raw
+    if not sys.stdout.isatty():
+        return blank
+    try:
+        from colorama import Fore
+    except ImportError:
+        return blank
+    return Fore
+
+
+async def _start_browser_pool(app):
+    """Create the browser pool shared by all handlers (browser launches on first use)."""
+    app['browser_pool'] = BrowserPool()
+
+
+async def _stop_browser_pool(app):
+    """Stop the shared browser on shutdown."""
+    await app['browser_pool'].close()
+
+
+async def _create_http_session(app):
+    """Create the pooled HTTP client session shared by all handlers."""
+    # The default connector caps at 100 connections; raise it explicitly
+    connector = aiohttp.TCPConnector(
+        limit=200,
+        limit_per_host=50,
+        ttl_dns_cache=300,
+        keepalive_timeout=60,
+    )
+    app['http_session'] = aiohttp.ClientSession(connector=connector)
+
+
+async def _close_http_session(app):
+    """Close the shared HTTP client session on shutdown."""
+    await app['http_session'].close()
+
 
+async def _tune_response_socket(request, response):
+    """
+    Tune the client socket before a response is sent.
+
+    Enlarges the send buffer so large JSON bodies go to the kernel in few
+    writes, and only disables Nagle's algorithm for small bodies, which
+    benefit from being flushed immediately.
+    """
+    transport = request.transport
+    sock = transport.get_extra_info('socket') if transport else None
+    if sock is None:
+        return
+
+    body = getattr(response, 'body', None)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SERVER_SEND_BUFFER_SIZE)
+        if isinstance(body, (bytes, bytearray)) and sock.family in (socket.AF_INET, socket.AF_INET6):
+            nodelay = len(body) <= SERVER_NODELAY_MAX_BODY
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, nodelay)
+    except OSError:
+        pass  # Best effort; the defaults still work
+
+
+async def _announce_shutdown(app):
+    """Tell the console the server is stopping."""
+    fore = console_colors()
+    print(f"\n{fore.YELLOW}[*] Shutting down gracefully...{fore.WHITE}")
 
-async def start_server():
+
+def start_server(loop: Optional[asyncio.AbstractEventLoop] = None):
     """
     Start aiohttp web server for token generation and scraping API.
-    
-    The server runs indefinitely until interrupted.
-    
+
+    Blocks until the process is interrupted, then shuts the app down.
+
+    Args:
+        loop: Event loop to run the server on (default: a new asyncio loop)
+
     Endpoints:
     - POST /sign - Generate tokens for Trip.com API
     - POST /scrape - Scrape flight data from Trip.com
     """
-    app = web.Application()
+    app = web.Application(client_max_size=SERVER_MAX_REQUEST_SIZE)
     app.router.add_post('/sign', handle_sign)
     app.router.add_post('/scrape', handle_scrape)
     app.router.add_post('/scrape-browser', handle_scrape_browser)
-    
-    runner = web.AppRunner(app)
-    await runner.setup()
-    site = web.TCPSite(runner, SERVER_HOST, SERVER_PORT)
-    
-    print(f"{colorama.Fore.CYAN}[*] API Server running at http://localhost:{SERVER_PORT}{colorama.Fore.WHITE}")
-    print(f"{colorama.Fore.GREEN}[*] Available endpoints:")
+    app.on_startup.append(_start_browser_pool)
+    app.on_startup.append(_create_http_session)
+    app.on_shutdown.append(_announce_shutdown)
+    app.on_cleanup.append(_stop_browser_pool)
+    app.on_cleanup.append(_close_http_session)
+    app.on_response_prepare.append(_tune_response_socket)
+
+    fore = console_colors()
+    print(f"{fore.CYAN}[*] API Server running at http://localhost:{SERVER_PORT}{fore.WHITE}")
+    print(f"{fore.GREEN}[*] Available endpoints:")
     print(f"  - POST /sign           - Generate tokens")
     print(f"  - POST /scrape         - Scrape flight data")
-    print(f"  - POST /scrape-browser - Scrape via browser interception{colorama.Fore.WHITE}")
-    await site.start()
-    
-    # Keep alive forever
-    while True:
-        await asyncio.sleep(3600)
+    print(f"  - POST /scrape-browser - Scrape via browser interception{fore.WHITE}")
+
+    web.run_app(
+        app,
+        host=SERVER_HOST,
+        port=SERVER_PORT,
+        backlog=SERVER_BACKLOG,
+        # Lets several server processes share the port (not available on Windows)
+        reuse_port=hasattr(socket, 'SO_REUSEPORT'),
+        access_log=None,  # Requests are logged by the handlers
+        handle_signals=True,
+        shutdown_timeout=10,
+        print=None,
+        loop=loop,
+    )
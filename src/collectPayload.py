@@ -4,7 +4,7 @@ from models.payload_models import PayloadData
 
 def encode_payload():
     e = 16384
-    t = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+    t = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
     
     def encoder(i):
         # Convert string to bytes (UTF-8 encoded)
@@ -20,7 +20,7 @@ def encode_payload():
             a = 0
             l = 0
             c = 0
-            d = []
+            d = bytearray()  # Output symbols, written as ASCII bytes
             
             def get_min(x, y):
                 return min(x, y)
@@ -145,7 +145,7 @@ def encode_payload():
             elif c == 4:
                 write_char((l << 2) & 63)
             
-            return ''.join(d)
+            return d.decode('ascii')
         
         return compress(n)
     
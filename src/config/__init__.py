@@ -3,10 +3,22 @@
 from .settings import (
     SERVER_HOST,
     SERVER_PORT,
+    SERVER_BACKLOG,
+    SERVER_SEND_BUFFER_SIZE,
+    SERVER_NODELAY_MAX_BODY,
+    SERVER_MAX_REQUEST_SIZE,
+    LOG_LEVEL,
+    DEBUG,
     CHROME_PATH,
     TARGET_URL,
     BROWSER_ARGS,
+    BROWSER_MAX_TABS,
+    BROWSER_HEADLESS,
+    BROWSER_CDP_HOST,
+    BROWSER_CDP_PORT,
+    BROWSER_ISOLATE_CONTEXTS,
     TRIP_API_ENDPOINT,
+    TRIP_SSE_ENDPOINT,
     TRIP_TYPE_MAPPING,
     BROWSER_NAVIGATION_TIMEOUT,
     BROWSER_WAIT_TIMEOUT,
@@ -16,10 +28,22 @@ from .settings import (
 __all__ = [
     'SERVER_HOST',
     'SERVER_PORT',
+    'SERVER_BACKLOG',
+    'SERVER_SEND_BUFFER_SIZE',
+    'SERVER_NODELAY_MAX_BODY',
+    'SERVER_MAX_REQUEST_SIZE',
+    'LOG_LEVEL',
+    'DEBUG',
     'CHROME_PATH',
     'TARGET_URL',
     'BROWSER_ARGS',
+    'BROWSER_MAX_TABS',
+    'BROWSER_HEADLESS',
+    'BROWSER_CDP_HOST',
+    'BROWSER_CDP_PORT',
+    'BROWSER_ISOLATE_CONTEXTS',
     'TRIP_API_ENDPOINT',
+    'TRIP_SSE_ENDPOINT',
     'TRIP_TYPE_MAPPING',
     'BROWSER_NAVIGATION_TIMEOUT',
     'BROWSER_WAIT_TIMEOUT',
@@ -5,6 +5,16 @@ import os
 # Server Configuration
 SERVER_HOST = "0.0.0.0"
 SERVER_PORT = 11000
+SERVER_BACKLOG = 2048
+SERVER_SEND_BUFFER_SIZE = 256 * 1024  # SO_SNDBUF for response sockets
+SERVER_NODELAY_MAX_BODY = 16 * 1024  # Bodies up to this size are sent without Nagle delay
+SERVER_MAX_REQUEST_SIZE = 1024 * 1024  # Larger request bodies are rejected with 413
+
+# Logging
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+
+# Include tracebacks in API error responses (never enable in production)
+DEBUG = os.environ.get("DEBUG", "").lower() in ("1", "true", "yes")
 
 # Browser Configuration
 CHROME_PATH = "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe"
@@ -21,8 +31,24 @@ BROWSER_ARGS = [
     "--enable-features=WebContentsForceDark"
 ]
 
+# Maximum number of tabs open at once on the shared browser; requests beyond
+# this wait for a free tab
+BROWSER_MAX_TABS = int(os.environ.get("MAX_BROWSERS", 10))
+
+# Run the launched browser without a window
+BROWSER_HEADLESS = os.environ.get("BROWSER_HEADLESS", "").lower() in ("1", "true", "yes")
+
+# Attach to a Chrome already started with --remote-debugging-port instead of
+# launching one; leave BROWSER_CDP_PORT unset to launch CHROME_PATH
+BROWSER_CDP_HOST = os.environ.get("BROWSER_CDP_HOST", "127.0.0.1")
+BROWSER_CDP_PORT = int(os.environ["BROWSER_CDP_PORT"]) if os.environ.get("BROWSER_CDP_PORT") else None
+
+# Give every tab its own browser context (separate cookies and storage)
+BROWSER_ISOLATE_CONTEXTS = True
+
 # Trip.com API Configuration
 TRIP_API_ENDPOINT = "/restapi/soa2/14427/GetLowPriceInCalender"
+TRIP_SSE_ENDPOINT = "/restapi/soa2/27015/FlightListSearchSSE"
 
 # Trip type mapping
 TRIP_TYPE_MAPPING = {
@@ -31,7 +57,7 @@ TRIP_TYPE_MAPPING = {
     3: 'MT'   # Multi Trip
 }
 
-# Timeouts (in seconds)
+# Timeouts (in seconds); the browser ones are upper bounds on page-load waits
 BROWSER_NAVIGATION_TIMEOUT = 5
 BROWSER_WAIT_TIMEOUT = 3
 TOKEN_GENERATION_TIMEOUT = 10
@@ -1,6 +1,6 @@
 """Core functionality for browser automation and token generation."""
 
-from .browser_manager import BrowserManager
+from .browser_manager import BrowserManager, BrowserPool
 from .token_generator import TokenGenerator
 
-__all__ = ['BrowserManager', 'TokenGenerator']
+__all__ = ['BrowserManager', 'BrowserPool', 'TokenGenerator']
@@ -1,72 +1,291 @@
 """Browser automation and session management."""
 
 import asyncio
+import logging
+from typing import Optional
+
 import zendriver as zd
+from zendriver import cdp
 from fake_useragent import UserAgent
 
-from src.config import CHROME_PATH, TARGET_URL, BROWSER_ARGS, BROWSER_NAVIGATION_TIMEOUT, BROWSER_WAIT_TIMEOUT
+from src.config import (
+    CHROME_PATH,
+    TARGET_URL,
+    BROWSER_ARGS,
+    BROWSER_MAX_TABS,
+    BROWSER_HEADLESS,
+    BROWSER_CDP_HOST,
+    BROWSER_CDP_PORT,
+    BROWSER_ISOLATE_CONTEXTS,
+    BROWSER_NAVIGATION_TIMEOUT,
+    BROWSER_WAIT_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+# `wait_until` values accepted by navigate_to_url, mapped to document.readyState
+READY_STATES = {
+    'domcontentloaded': 'interactive',
+    'load': 'complete',
+}
+
+# Loading the user-agent database is slow, so do it once per process
+_UA = UserAgent(browsers="Chrome")
+
+
+class BrowserPool:
+    """Shares one long-lived browser across requests, handing out one tab per session."""
+
+    def __init__(self, max_tabs: int = BROWSER_MAX_TABS):
+        self.browser = None
+        self._start_lock = asyncio.Lock()
+        self._tab_slots = asyncio.Semaphore(max_tabs)
+        self._attached = False
+        # target_id -> browser context id, for tabs opened in their own context
+        self._contexts = {}
+
+    async def start(self):
+        """
+        Launch the shared browser, or attach to the one at BROWSER_CDP_PORT, if not done yet.
+
+        Returns:
+            The shared browser instance
+        """
+        async with self._start_lock:
+            if self.browser is None:
+                if BROWSER_CDP_PORT:
+                    self.browser = await zd.start(host=BROWSER_CDP_HOST, port=BROWSER_CDP_PORT)
+                    self._attached = True
+                else:
+                    browser_args = BROWSER_ARGS.copy()
+                    browser_args.append(f"--user-agent={_UA.random}")
+
+                    self.browser = await zd.start(
+                        browser_executable_path=CHROME_PATH,
+                        headless=BROWSER_HEADLESS,
+                        sandbox=False,
+                        browser_args=browser_args,
+                    )
+
+        return self.browser
+
+    async def new_tab(self, url: str = TARGET_URL):
+        """
+        Open a new tab on the shared browser.
+
+        Waits while `max_tabs` tabs are already in use. Every tab returned
+        here must be given back through `close_tab`.
+
+        Args:
+            url: URL to open in the new tab
+
+        Returns:
+            The new tab
+        """
+        await self._tab_slots.acquire()
+        try:
+            browser = await self.start()
+            if BROWSER_ISOLATE_CONTEXTS:
+                return await self._new_isolated_tab(browser, url)
+            return await browser.get(url, new_tab=True)
+        except Exception:
+            self._tab_slots.release()
+            raise
+
+    async def _new_isolated_tab(self, browser, url: str):
+        """Open `url` in a tab inside a fresh browser context."""
+        context_id = await browser.connection.send(
+            cdp.target.create_browser_context(dispose_on_default_browser_context_destroy=True)
+        )
+        try:
+            target_id = await browser.connection.send(
+                cdp.target.create_target(url, browser_context_id=context_id)
+            )
+            tab = await self._find_tab(browser, target_id)
+        except Exception:
+            await self._dispose_context(context_id)
+            raise
+
+        self._contexts[target_id] = context_id
+        return tab
+
+    @staticmethod
+    async def _find_tab(browser, target_id, attempts: int = 50):
+        """Return the tab object for `target_id` once the browser has registered it."""
+        for _ in range(attempts):
+            for tab in browser.tabs:
+                if tab.target_id == target_id:
+                    return tab
+            await browser.update_targets()
+            await asyncio.sleep(0.01)
+        raise RuntimeError(f"Tab for target {target_id} did not appear")
+
+    async def _dispose_context(self, context_id):
+        """Dispose a browser context, dropping its tabs, cookies and storage."""
+        try:
+            await self.browser.connection.send(cdp.target.dispose_browser_context(context_id))
+        except Exception as e:
+            logger.warning("Error disposing browser context: %s", e)
+
+    async def close_tab(self, tab):
+        """Close a tab obtained from `new_tab` and free its slot."""
+        context_id = self._contexts.pop(tab.target_id, None)
+        try:
+            await tab.close()
+        except Exception:
+            pass  # Ignore errors closing tab
+        finally:
+            self._tab_slots.release()
+
+        if context_id is not None and self.browser:
+            await self._dispose_context(context_id)
+
+    async def close(self):
+        """Stop the shared browser, or just disconnect from one we attached to."""
+        browser = self.browser
+        self.browser = None
+        self._contexts.clear()
+        if not browser:
+            return
+
+        if self._attached:
+            await browser.connection.aclose()
+        else:
+            await browser.stop()
 
 
 class BrowserManager:
-    """Manages browser sessions for token generation."""
-    
-    def __init__(self):
-        self.ua = UserAgent(browsers="Chrome")
+    """Manages a browser session (one tab of a shared browser) for token generation."""
+
+    def __init__(self, pool: Optional[BrowserPool] = None):
+        # Without a shared pool the manager owns a private one and stops it on close()
+        self._owns_pool = pool is None
+        self.pool = pool if pool is not None else BrowserPool(max_tabs=1)
         self.browser = None
         self.tab = None
-    
+        # Init script source -> CDP identifier, for scripts registered on self.tab
+        self._init_scripts = {}
+
     async def create_session(self):
         """
-        Create a fresh browser session with anti-detection features.
-        
+        Open a fresh tab on the pooled browser.
+
         Returns:
             tuple: (browser, tab) instances
         """
-        browser_args = BROWSER_ARGS.copy()
-        browser_args.append(f"--user-agent={self.ua.random}")
-        
-        self.browser = await zd.start(
-            browser_executable_path=CHROME_PATH,
-            sandbox=False,
-            browser_args=browser_args,
-        )
-
-        self.tab = await self.browser.get(TARGET_URL)
-        await asyncio.sleep(BROWSER_WAIT_TIMEOUT)
+        self.tab = await self.pool.new_tab(TARGET_URL)
+        self.browser = self.pool.browser
+        await self._wait_for_ready_state('load', BROWSER_WAIT_TIMEOUT)
 
         return self.browser, self.tab
-    
-    async def navigate_to_url(self, url: str, wait_load: bool = True):
+
+    async def navigate_to_url(self, url: str, wait_until: Optional[str] = 'load'):
         """
         Navigate to a specific URL.
-        
+
         Args:
             url: Target URL to navigate to
-            wait_load: Whether to wait for navigation timeout (default: True)
+            wait_until: Page state to wait for, 'load' (default) or
+                'domcontentloaded'; None returns right after navigation starts.
+                The wait is capped at BROWSER_NAVIGATION_TIMEOUT seconds.
         """
         if not self.tab:
             raise RuntimeError("Browser session not initialized")
-        
+
         await self.tab.get(url)
-        if wait_load:
-            await asyncio.sleep(BROWSER_NAVIGATION_TIMEOUT)
-    
+        if wait_until:
+            await self._wait_for_ready_state(wait_until, BROWSER_NAVIGATION_TIMEOUT)
+
+    async def _wait_for_ready_state(self, wait_until: str, timeout: float):
+        """Wait until the page reaches `wait_until`, giving up silently after `timeout` seconds."""
+        try:
+            until = READY_STATES[wait_until]
+        except KeyError:
+            raise ValueError(f"Unsupported wait_until value: {wait_until!r}")
+
+        try:
+            await self.tab.wait_for_ready_state(until, timeout=timeout)
+        except asyncio.TimeoutError:
+            pass  # Slow page; carry on, the old fixed delay did the same
+
+    async def wait_for_condition(self, expression: str, timeout: float, interval: float = 0.02) -> bool:
+        """
+        Poll a JavaScript expression until it is truthy.
+
+        Args:
+            expression: JavaScript expression to evaluate
+            timeout: Maximum wait time in seconds
+            interval: Delay between checks in seconds (default: 20ms)
+
+        Returns:
+            True if the condition was met, False on timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        while True:
+            if await self.execute_script(expression):
+                return True
+            if loop.time() >= deadline:
+                return False
+            await asyncio.sleep(interval)
+
+    async def add_init_script(self, source: str):
+        """
+        Run a script at the start of every new document in the session's tab.
+
+        The script runs before any page script. Registering the same source
+        again is a no-op.
+
+        Args:
+            source: JavaScript source to evaluate on each new document
+
+        Returns:
+            CDP identifier of the registered script
+        """
+        if not self.tab:
+            raise RuntimeError("Browser session not initialized")
+
+        if source not in self._init_scripts:
+            self._init_scripts[source] = await self.tab.send(
+                cdp.page.add_script_to_evaluate_on_new_document(source=source)
+            )
+        return self._init_scripts[source]
+
+    async def add_binding(self, name: str, callback):
+        """
+        Expose a `window.<name>(payload)` function to pages in the session's tab.
+
+        Args:
+            name: Global function name to expose
+            callback: Called with the string payload each time a page calls the binding
+        """
+        if not self.tab:
+            raise RuntimeError("Browser session not initialized")
+
+        def on_binding_called(event: cdp.runtime.BindingCalled):
+            if event.name == name:
+                callback(event.payload)
+
+        self.tab.add_handler(cdp.runtime.BindingCalled, on_binding_called)
+        await self.tab.send(cdp.runtime.add_binding(name=name))
+
     async def execute_script(self, script: str):
         """
         Execute JavaScript in the browser context.
-        
+
         Args:
             script: JavaScript code to execute
-            
+
         Returns:
             Result of script execution
-            
+
         Raises:
             RuntimeError: If browser session not initialized or connection broken
         """
         if not self.tab:
             raise RuntimeError("Browser session not initialized")
-        
+
         try:
             return await self.tab.evaluate(script)
         except Exception as e:
@@ -75,35 +294,18 @@ class BrowserManager:
             if 'close frame' in error_msg or 'connection' in error_msg or 'websocket' in error_msg:
                 raise RuntimeError(f"Browser connection lost: {e}")
             raise
-    
+
     async def close(self):
-        """Close the browser session and clean up resources."""
-        if self.browser:
-            try:
-                # Clear references first
-                tab = self.tab
-                browser = self.browser
-                self.tab = None
-                self.browser = None
-                
-                # Close tab if it exists
-                if tab:
-                    try:
-                        await tab.close()
-                    except:
-                        pass  # Ignore errors closing tab
-                
-                # Delay before stopping browser
-                await asyncio.sleep(0.5)
-                
-                # Stop the browser
-                await browser.stop()
-                
-                # IMPORTANT: Longer delay to ensure full cleanup before next browser starts
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                print(f"[BrowserManager] Error during browser close: {e}")
-            finally:
-                self.browser = None
-                self.tab = None
+        """Close the session's tab; the shared browser keeps running."""
+        tab = self.tab
+        self.tab = None
+        self.browser = None
+        self._init_scripts = {}
+
+        try:
+            if tab:
+                await self.pool.close_tab(tab)
+            if self._owns_pool:
+                await self.pool.close()
+        except Exception as e:
+            logger.warning("Error during browser close: %s", e)
@@ -1,19 +1,42 @@
 """Core token generation logic."""
 
 import json
-import asyncio
+from typing import Optional
 
-from src.core.browser_manager import BrowserManager
+from src.core.browser_manager import BrowserManager, BrowserPool
+from src.config import TOKEN_GENERATION_TIMEOUT
 from src.services.url_builder import build_flight_url
 from src.services.w_payload_service import generate_w_payload
 from src.services.x_ctx_service import generate_x_ctx_header
 
+_BROWSER_TOKENS_READY = "typeof window.signature === 'function' && typeof window.c_sign !== 'undefined'"
+
+# Filled with (request payload JSON, W payload MD5 JSON) via %-formatting
+_BROWSER_TOKENS_SCRIPT = """(() => {
+    let signature, wPayloadSource;
+    try {
+        if (typeof window.signature === 'function') {
+            signature = window.signature(%s);
+        } else {
+            signature = "ERROR: window.signature not found";
+        }
+    } catch (err) {
+        signature = "ERROR: " + err.toString();
+    }
+    try {
+        wPayloadSource = window.c_sign.toString(%s);
+    } catch (e) {
+        wPayloadSource = "ERROR: " + e.toString();
+    }
+    return JSON.stringify({signature: signature, w_payload_source: wPayloadSource});
+})()"""
+
 
 class TokenGenerator:
     """Handles generation of all required tokens."""
     
-    def __init__(self):
-        self.browser_manager = BrowserManager()
+    def __init__(self, browser_pool: Optional[BrowserPool] = None):
+        self.browser_manager = BrowserManager(browser_pool)
     
     async def generate_tokens(self, data: dict) -> dict:
         """
@@ -25,26 +48,23 @@ class TokenGenerator:
         Returns:
             dict: Contains signature, w_payload_source, and x_ctx_wclient_req
         """
-        browser = None
-        
         try:
             # Create browser session
-            browser, tab = await self.browser_manager.create_session()
+            await self.browser_manager.create_session()
             
             # Build and navigate to URL
             url = build_flight_url(data)
             await self.browser_manager.navigate_to_url(url)
             
-            # Generate signature token
-            signature = await self._generate_signature(data)
-            
-            # Generate W payload
-            w_payload_dict, w_payload_md5 = generate_w_payload(data)
-            w_payload_source = await self._generate_w_payload_source(w_payload_md5)
+            # Generate W payload (its MD5 is an input to the browser script)
+            w_payload, w_payload_md5 = generate_w_payload(data)
             
             # Generate X-CTX header
             x_ctx = generate_x_ctx_header(data)
             
+            # Generate signature and W payload source in one browser round-trip
+            signature, w_payload_source = await self._generate_browser_tokens(data, w_payload_md5)
+            
             return {
                 "signature": signature,
                 "w_payload_source": w_payload_source,
@@ -52,55 +72,30 @@ class TokenGenerator:
             }
         
         finally:
-            if browser:
-                await self.browser_manager.close()
+            # Also frees the tab's pool slot when create_session failed after opening it
+            await self.browser_manager.close()
     
-    async def _generate_signature(self, data: dict) -> str:
+    async def _generate_browser_tokens(self, data: dict, w_payload_md5: str) -> tuple[str, str]:
         """
-        Generate signature token using browser JavaScript execution.
+        Generate the signature token and W payload source with a single script evaluation.
         
         Args:
             data: Request payload
-            
-        Returns:
-            Signature token string
-        """
-        input_token = json.dumps(data)
-        
-        script = f"""
-        (() => {{
-            try {{
-                if (typeof window.signature === 'function') {{
-                    return window.signature({input_token});
-                }} else {{
-                    return "ERROR: window.signature not found";
-                }}
-            }} catch (err) {{
-                return "ERROR: " + err.toString();
-            }}
-        }})()
-        """
-        
-        return await self.browser_manager.execute_script(script)
-    
-    async def _generate_w_payload_source(self, w_payload_md5: str) -> str:
-        """
-        Generate W payload source using browser JavaScript execution.
-        
-        Args:
             w_payload_md5: MD5 hash of W payload
             
         Returns:
-            W payload source string
-        """
-        script = f"""
-        (() => {{
-            try {{
-                return window.c_sign.toString({json.dumps(w_payload_md5)});
-            }} catch (e) {{
-                return "ERROR: " + e.toString();
-            }}
-        }})()
+            tuple: (signature, w_payload_source)
         """
+        # The page defines window.signature and window.c_sign asynchronously after load
+        await self.browser_manager.wait_for_condition(
+            _BROWSER_TOKENS_READY,
+            timeout=TOKEN_GENERATION_TIMEOUT,
+        )
+
+        script = _BROWSER_TOKENS_SCRIPT % (
+            json.dumps(data, separators=(',', ':')),
+            json.dumps(w_payload_md5),
+        )
         
-        return await self.browser_manager.execute_script(script)
+        result = json.loads(await self.browser_manager.execute_script(script))
+        return result['signature'], result['w_payload_source']
@@ -2,5 +2,6 @@
 
 from .payload_models import PayloadData
 from .w_payload_models import WPayload
+from .search_models import SearchParams, ParsedURL
 
-__all__ = ['PayloadData', 'WPayload']
+__all__ = ['PayloadData', 'WPayload', 'SearchParams', 'ParsedURL']
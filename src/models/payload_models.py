@@ -1,6 +1,26 @@
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+import time
+
+# Constant runs of the context array, spliced in by PayloadData._build_context
+_CONTEXT_STATIC_HEAD = (1, 6, "1.3.78/new/t", 100014851, None, None, "online")
+_CONTEXT_STATIC_TAIL = (
+    "en-us",
+    "",
+    "",
+    '{"version":"","net":"None","platform":""}',
+    1.25,
+    '{"fef_name":"","fef_ver":"","rg":"","lang":"en-ID","lizard":""}',
+    "SGP-ALI",
+    "100014851-0a9aa022-491596-282364",
+    None,
+    None,
+    "",
+    True,
+    False,
+    None,
+    None
+)
 
 @dataclass
 class FlightSegment:
@@ -9,11 +29,25 @@ class FlightSegment:
     aport: str
     takeofftime: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'sequence': self.sequence,
+            'dport': self.dport,
+            'aport': self.aport,
+            'takeofftime': self.takeofftime
+        }
+
 @dataclass
 class SegmentInfo:
     segmentno: int
     segments: List[FlightSegment]
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'segmentno': self.segmentno,
+            'segments': [segment.to_dict() for segment in self.segments]
+        }
+
 @dataclass
 class FlightInformation:
     segmentinfo: List[SegmentInfo]
@@ -22,6 +56,15 @@ class FlightInformation:
     child: int
     infant: int
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'segmentinfo': [info.to_dict() for info in self.segmentinfo],
+            'airlineclass': self.airlineclass,
+            'adult': self.adult,
+            'child': self.child,
+            'infant': self.infant
+        }
+
 @dataclass
 class BusinessData:
     enterTs: int
@@ -48,6 +91,34 @@ class BusinessData:
     _ubt_user_data_length: int
     ubt_reqid: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Field-by-field equivalent of dataclasses.asdict, without its recursive deepcopy"""
+        return {
+            'enterTs': self.enterTs,
+            'instKey': self.instKey,
+            'npmVersion': self.npmVersion,
+            'npmEnterTs': self.npmEnterTs,
+            'init_cki': self.init_cki,
+            'bizTokens': list(self.bizTokens),
+            'eid': self.eid,
+            'framework': self.framework,
+            'tcpSend': self.tcpSend,
+            'isSupportWasm': self.isSupportWasm,
+            'isOverseas': self.isOverseas,
+            'tld': self.tld,
+            'captainAppId': self.captainAppId,
+            'lsSize': self.lsSize,
+            'ubt_language': self.ubt_language,
+            'ubt_currency': self.ubt_currency,
+            'ubt_site': self.ubt_site,
+            'ubt_locale': self.ubt_locale,
+            'wcVersion': self.wcVersion,
+            'flighttype': self.flighttype,
+            'flightinformation': self.flightinformation.to_dict(),
+            '_ubt_user_data_length': self._ubt_user_data_length,
+            'ubt_reqid': self.ubt_reqid
+        }
+
 @dataclass
 class UbtEvent:
     event_type: int
@@ -81,7 +152,7 @@ class PayloadData:
     ) -> 'PayloadData':
         """Factory method to create flight search payload"""
         
-        timestamp = int(datetime.now().timestamp() * 1000)
+        timestamp = time.time_ns() // 1_000_000
         
         # Build segments
         segments = [
@@ -134,29 +205,26 @@ class PayloadData:
         )
         
         return cls(
-            context=cls._build_context(**kwargs),
-            business=[None, None, None, None, None, None, None, None, None, None, asdict(business_data)],
+            context=cls._build_context(_ts=timestamp, **kwargs),
+            business=[None, None, None, None, None, None, None, None, None, None, business_data.to_dict()],
             user=[None, kwargs.get('ab_test_string', ''), None, ''],
             ubtList=[[1, timestamp, "pv", None, None]],
             sendTs=timestamp
         )
     
     @staticmethod
-    def _build_context(**kwargs) -> List[Any]:
-        """Build context array"""
+    def _build_context(_ts: Optional[int] = None, **kwargs) -> List[Any]:
+        """Build context array; `_ts` is the payload's millisecond timestamp, if already known"""
+        if _ts is None:
+            _ts = time.time_ns() // 1_000_000
+        user_id = kwargs.get('user_id', '10320667452')
         return [
-            kwargs.get('user_id', '10320667452'),
-            kwargs.get('session_id', f"{int(datetime.now().timestamp() * 1000)}.65f8Qt49rXge"),
-            1,
-            6,
-            "1.3.78/new/t",
-            100014851,
-            None,
-            None,
-            "online",
+            user_id,
+            kwargs.get('session_id', f"{_ts}.65f8Qt49rXge"),
+            *_CONTEXT_STATIC_HEAD,
             kwargs.get('device_id', '09034177410240614425'),
             kwargs.get('url', ''),
-            kwargs.get('user_id', '10320667452'),
+            user_id,
             5,
             1,
             kwargs.get('screen_width', 1536),
@@ -164,21 +232,7 @@ class PayloadData:
             kwargs.get('window_width', 1261),
             kwargs.get('window_height', 27),
             kwargs.get('scroll_height', 47),
-            "en-us",
-            "",
-            "",
-            '{"version":"","net":"None","platform":""}',
-            1.25,
-            '{"fef_name":"","fef_ver":"","rg":"","lang":"en-ID","lizard":""}',
-            "SGP-ALI",
-            "100014851-0a9aa022-491596-282364",
-            None,
-            None,
-            "",
-            True,
-            False,
-            None,
-            None
+            *_CONTEXT_STATIC_TAIL
         ]
     
     def to_dict(self) -> Dict[str, Any]:
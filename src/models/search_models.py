@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
+class SearchParams:
+    """Search parameters from a Trip.com flight search URL query"""
+    dcity: str  # Upper-cased city codes
+    acity: str
+    ddate: str
+    rdate: Optional[str]
+    triptype: str  # RT, OW, MT
+    cabin_class: str  # y, c, f (the `class` query parameter)
+    quantity: int
+    childqty: int
+    babyqty: int
+    locale: str
+    language: str  # Language part of the locale, e.g. 'en' for 'en-ID'
+    curr: str
+    lowpricesource: str
+    dairport: str  # Upper-cased airport codes, '' when not given
+    aairport: str
+    pagesource: str
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedURL:
+    """Parsed Trip.com flight search URL"""
+    url: str
+    hostname: str
+    region: str
+    params: SearchParams
+    origin: str  # https://<hostname>
+    sse_url: str  # FlightListSearchSSE endpoint on the same origin
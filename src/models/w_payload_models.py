@@ -1,19 +1,53 @@
-from dataclasses import dataclass, asdict
+import random
+import re
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Any
 
-@dataclass
+# `os=` / `osv=` entries of the x-ua extension, e.g. "v=3_os=ONLINE_osv=10"
+_XUA_RE = re.compile(r'(?:^|_)(?:os=(?P<os>[^_]*)|osv=(?P<osv>[^_]*))')
+
+# Head extensions read by WPayload.from_input_payload; all others are skipped
+_USED_EXTENSIONS = frozenset({
+    'x-ua',
+    'PageId',
+    'Flt_BatchId',
+    'allianceID',
+    'sid',
+    'ouid',
+    'useDistributionType',
+    'sotpLocale',
+    'vid',
+    'flt_app_session_transactionId',
+    'sotpGroup',
+    'source',
+    'sotpCurrency',
+    'Flt_SessionId',
+    'pvid',
+})
+
+@dataclass(slots=True)
 class TravelerNum:
     """Passenger count details"""
     adult: int
     child: int
     infant: int
 
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'adult': self.adult,
+            'child': self.child,
+            'infant': self.infant
+        }
+
+@dataclass(slots=True)
 class SearchInfo:
     """Search information containing traveler details"""
     travelerNum: TravelerNum
 
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        return {'travelerNum': self.travelerNum.to_dict()}
+
+@dataclass(slots=True)
 class AllianceInfo:
     """Alliance information for the request"""
     AllianceID: int = 0
@@ -21,7 +55,15 @@ class AllianceInfo:
     OuID: str = ""
     UseDistributionType: int = 1
 
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'AllianceID': self.AllianceID,
+            'SID': self.SID,
+            'OuID': self.OuID,
+            'UseDistributionType': self.UseDistributionType
+        }
+
+@dataclass(slots=True)
 class ExtendFields:
     """Extended fields for additional request metadata"""
     PageId: str
@@ -31,7 +73,17 @@ class ExtendFields:
     BatchedId: str = ""
     flightsignature: str = ""
 
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'PageId': self.PageId,
+            'Os': self.Os,
+            'OsVersion': self.OsVersion,
+            'SpecialSupply': self.SpecialSupply,
+            'BatchedId': self.BatchedId,
+            'flightsignature': self.flightsignature
+        }
+
+@dataclass(slots=True)
 class Head:
     """Request header information"""
     AbTesting: str
@@ -48,7 +100,24 @@ class Head:
     SessionId: str = "1"
     PvId: str = "13"
 
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'AbTesting': self.AbTesting,
+            'Locale': self.Locale,
+            'VID': self.VID,
+            'AllianceInfo': self.AllianceInfo.to_dict(),
+            'TransactionID': self.TransactionID,
+            'ExtendFields': self.ExtendFields.to_dict(),
+            'ClientID': self.ClientID,
+            'Group': self.Group,
+            'Source': self.Source,
+            'Currency': self.Currency,
+            'Version': self.Version,
+            'SessionId': self.SessionId,
+            'PvId': self.PvId
+        }
+
+@dataclass(slots=True)
 class WPayload:
     """Main W payload structure for flight search"""
     dCity: str
@@ -95,21 +164,21 @@ class WPayload:
         journey_info_0 = journey_info[0]
         journey_info_1 = journey_info[1] if len(journey_info) > 1 else None
         
-        # Parse extensions
-        extensions = {
-            ext['name']: ext.get('value', '') 
-            for ext in input_payload[head_key]['extension']
-        }
+        # Parse the extensions we use, in a single pass
+        extensions = {}
+        for ext in input_payload[head_key]['extension']:
+            name = ext['name']
+            if name in _USED_EXTENSIONS:
+                extensions[name] = ext.get('value', '')
         
         # Build AbTesting string from abtList
-        ab_testing_parts = []
-        for i, abt in enumerate(input_payload.get('abtList', [])):
-            # Generate random number between 0-100
-            import random
-            random_num = random.randint(0, 100)
-            ab_code = abt.get('abCode', '')
-            ab_version = abt.get('abVersion', 'A')
-            ab_testing_parts.append(f"M:{random_num},{ab_code}:{ab_version}")
+        abt_list = input_payload.get('abtList', ())
+        # One random number between 0-100 per entry
+        random_nums = random.choices(range(101), k=len(abt_list))
+        ab_testing_parts = [
+            f"M:{random_num},{abt.get('abCode', '')}:{abt.get('abVersion', 'A')}"
+            for random_num, abt in zip(random_nums, abt_list)
+        ]
         
         ab_testing = ';'.join(ab_testing_parts) + ';' if ab_testing_parts else ''
         
@@ -128,16 +197,13 @@ class WPayload:
         # Parse x-ua safely: format is "v=3_os=ONLINE_osv=10"
         os_name = 'Mac OS'
         os_version = '10.15.7'
-        if 'x-ua' in extensions and extensions['x-ua']:
-            try:
-                parts = extensions['x-ua'].split('_')
-                for part in parts:
-                    if part.startswith('os='):
-                        os_name = part.replace('os=', '')
-                    elif part.startswith('osv='):
-                        os_version = part.replace('osv=', '')
-            except:
-                pass  # Use defaults
+        xua = extensions.get('x-ua')
+        if isinstance(xua, str):  # Client JSON may carry any type; others keep the defaults
+            for match in _XUA_RE.finditer(xua):
+                if match.group('os') is not None:
+                    os_name = match.group('os')
+                else:
+                    os_version = match.group('osv')
         
         extend_fields = ExtendFields(
             PageId=extensions.get('PageId', ''),
@@ -192,4 +258,20 @@ class WPayload:
         Returns:
             Dictionary representation of the payload
         """
-        return asdict(self)
+        return {
+            'dCity': self.dCity,
+            'aCity': self.aCity,
+            'dDate': self.dDate,
+            'flightWayType': self.flightWayType,
+            'departureAirport': self.departureAirport,
+            'arrivalAirport': self.arrivalAirport,
+            'cabinClass': self.cabinClass,
+            'transferType': self.transferType,
+            'searchInfo': self.searchInfo.to_dict() if self.searchInfo is not None else None,
+            'abtList': list(self.abtList),
+            'offSet': self.offSet,
+            'aDate': self.aDate,
+            'startInterval': self.startInterval,
+            'endInterval': self.endInterval,
+            'Head': self.Head.to_dict() if self.Head is not None else None
+        }
@@ -1,10 +1,196 @@
 """Browser response interceptor for capturing FlightListSearchSSE responses."""
 
 import asyncio
-import json
+import logging
 from typing import Dict, Any, Optional, List
 import base64
 
+from src.utils import json_utils
+
+logger = logging.getLogger(__name__)
+
+# Keys whose presence in a captured body means it carries flight results
+_FLIGHT_DATA_MARKERS = (b"flightList", b"itineraryList", b"basicInfo")
+
+# Installed on every new document of the tab; hooks fetch/XHR to capture FlightListSearchSSE
+_INTERCEPTOR_SCRIPT = """
+(() => {
+    // Runs at the start of every document; only hook fetch/XHR once
+    if (window._interceptorsActive) {
+        return;
+    }
+    window._flightSearchResponses = [];
+    window._allRequests = [];
+    window._interceptorsActive = true;
+
+    // Wake the Python side as soon as a capture completes (binding added by the interceptor)
+    const notifyReady = (url, size) => {
+        if (typeof window.__flightDataReady === 'function') {
+            window.__flightDataReady(JSON.stringify({url: url, size: size}));
+        }
+    };
+
+    // INTERCEPT FETCH (Trip.com uses this for API requests)
+    const originalFetch = window.fetch;
+    window.fetch = async function(...args) {
+        const url = typeof args[0] === 'string' ? args[0] : args[0]?.url;
+
+        // Log ALL requests for debugging
+        window._allRequests.push({
+            url: url,
+            timestamp: Date.now(),
+            method: 'fetch'
+        });
+        console.log('[Interceptor] Fetch request:', url);
+
+        const response = await originalFetch.apply(this, args);
+
+        if (url && url.includes('FlightListSearchSSE')) {
+            console.log('[Interceptor] ✓ MATCHED FlightListSearchSSE request!');
+
+            // Clone response to avoid disrupting original flow
+            const clonedResponse = response.clone();
+
+            // Read stream in background (non-blocking)
+            (async () => {
+                try {
+                    const reader = clonedResponse.body.getReader();
+
+                    // Raw byte chunks; they are only base64-encoded when Python fetches the body
+                    const entry = {
+                        url: url,
+                        status: response.status,
+                        statusText: response.statusText,
+                        chunks: [],
+                        bodyLength: 0,
+                        timestamp: Date.now(),
+                        type: 'fetch_stream',
+                        isComplete: false
+                    };
+
+                    // Replace an earlier capture of the same URL
+                    const existingIndex = window._flightSearchResponses.findIndex(r => r.url === url);
+                    if (existingIndex >= 0) {
+                        window._flightSearchResponses[existingIndex] = entry;
+                    } else {
+                        window._flightSearchResponses.push(entry);
+                    }
+
+                    while (true) {
+                        const { done, value } = await reader.read();
+                        if (done) break;
+
+                        entry.chunks.push(value);
+                        entry.bodyLength += value.byteLength;
+                        entry.timestamp = Date.now();
+
+                        console.log('[Interceptor] Stream chunk received, total size:', entry.bodyLength);
+                    }
+
+                    // Mark as complete
+                    entry.isComplete = true;
+                    console.log('[Interceptor] ✓ Stream complete. Total size:', entry.bodyLength);
+                    notifyReady(url, entry.bodyLength);
+
+                } catch (err) {
+                    console.error("[Interceptor] Stream reading error:", err);
+                }
+            })();
+        }
+
+        return response;
+    };
+
+    // INTERCEPT XMLHttpRequest (Backup method)
+    const XHR = XMLHttpRequest.prototype;
+    const originalOpen = XHR.open;
+    const originalSend = XHR.send;
+
+    XHR.open = function(method, url, ...args) {
+        this._url = url;
+        this._method = method;
+
+        // Log ALL requests for debugging
+        window._allRequests.push({
+            url: url,
+            timestamp: Date.now(),
+            method: 'xhr'
+        });
+        console.log('[Interceptor] XHR request:', url);
+
+        return originalOpen.call(this, method, url, ...args);
+    };
+
+    XHR.send = function(...args) {
+        this.addEventListener('load', function() {
+            if (this._url && this._url.includes('FlightListSearchSSE')) {
+                console.log('[XHR-Interceptor] ✓ MATCHED FlightListSearchSSE!');
+                const bytes = new TextEncoder().encode(this.responseText);
+                window._flightSearchResponses.push({
+                    url: this._url,
+                    method: this._method,
+                    status: this.status,
+                    statusText: this.statusText,
+                    chunks: [bytes],
+                    bodyLength: bytes.byteLength,
+                    timestamp: Date.now(),
+                    type: 'xhr',
+                    isComplete: true
+                });
+                console.log('[XHR-Interceptor] Captured, size:', bytes.byteLength);
+                notifyReady(this._url, bytes.byteLength);
+            }
+        });
+        return originalSend.call(this, ...args);
+    };
+
+    console.log('[Interceptor] ✓ Setup complete - monitoring ALL requests');
+})();
+"""
+
+# Polled while waiting: describes the last captured response without its body
+_STATUS_SCRIPT = """
+(() => {
+    const responses = window._flightSearchResponses;
+    if (!responses || responses.length === 0) {
+        return null;
+    }
+    const last = responses[responses.length - 1];
+    return JSON.stringify({
+        count: responses.length,
+        url: last.url,
+        status: last.status,
+        size: last.bodyLength || 0,
+        isComplete: !!last.isComplete
+    });
+})()
+"""
+
+# Run once the response looks ready: returns the last captured response, its
+# body as base64 of the raw bytes
+_FETCH_SCRIPT = """
+(() => {
+    const last = window._flightSearchResponses[window._flightSearchResponses.length - 1];
+
+    // Build the binary string in slices to stay under the engine's argument-count limit
+    const parts = [];
+    for (const chunk of last.chunks) {
+        for (let i = 0; i < chunk.length; i += 0x8000) {
+            parts.push(String.fromCharCode.apply(null, chunk.subarray(i, i + 0x8000)));
+        }
+    }
+
+    return JSON.stringify({
+        url: last.url,
+        status: last.status,
+        statusText: last.statusText,
+        bodyB64: btoa(parts.join('')),
+        timestamp: last.timestamp,
+        type: last.type
+    });
+})()
+"""
+
 
 class BrowserResponseInterceptor:
     """Intercepts network responses in browser to capture FlightListSearchSSE data."""
@@ -15,6 +201,9 @@ class BrowserResponseInterceptor:
         self.response_captured = False
         self.captured_responses = []
         self.request_id_map = {}
+        self._reset_parse_state()
+        # Set by the page (via a CDP binding) whenever a captured response completes
+        self._response_ready = asyncio.Event()
     
     async def intercept_flight_search_response(self, url: str, timeout: int = 90) -> Dict[str, Any]:
         """
@@ -31,38 +220,31 @@ class BrowserResponseInterceptor:
             TimeoutError: If response not captured within timeout period
             Exception: For other errors during interception
         """
-        print(f"[BrowserResponseInterceptor] Opening URL: {url}")
+        logger.debug("Opening URL: %s", url)
         
         # Reset interceptor state for new request
         self.flight_data = None
         self.response_captured = False
         self.captured_responses = []
         self.request_id_map = {}
+        self._reset_parse_state()
+        self._response_ready = asyncio.Event()
         
-        # Navigate to URL first
-        print(f"[BrowserResponseInterceptor] Navigating to URL...") 
+        # Register the interceptor before navigating so it is in place before page scripts run
+        await self._install_js_interception()
+        
+        logger.debug("Navigating to URL...")
         tab = self.browser_manager.tab
         await tab.get(url)
         
-        # Wait a bit for page to start loading
-        await asyncio.sleep(1)
-        
-        # Inject interceptor ASAP after navigation but before page fully loads
-        print(f"[BrowserResponseInterceptor] Injecting interceptor on new page...")
-        await self._setup_js_interception()
-        
-        # Wait for page to fully load and make API requests
-        print(f"[BrowserResponseInterceptor] Waiting for API requests...")
-        await asyncio.sleep(3)
-        
         # Wait for FlightListSearchSSE response
-        print(f"[BrowserResponseInterceptor] Waiting for FlightListSearchSSE response...")
+        logger.debug("Waiting for FlightListSearchSSE response...")
         await self._wait_for_response(timeout)
         
         if not self.flight_data:
             raise Exception("Failed to capture FlightListSearchSSE response")
         
-        print(f"[BrowserResponseInterceptor] Successfully captured response")
+        logger.debug("Successfully captured response")
         return self.flight_data
     
     async def _setup_cdp_interception(self):
@@ -73,147 +255,31 @@ class BrowserResponseInterceptor:
             
             # Enable network tracking
             await tab.send("Network.enable")
-            print(f"[BrowserResponseInterceptor] CDP Network domain enabled")
+            logger.debug("CDP Network domain enabled")
             
             # Note: zendriver's event handling is different from playwright
             # For now, we'll rely on JavaScript interception which is more reliable
             # TODO: Implement proper zendriver CDP event handling
             
-            print(f"[BrowserResponseInterceptor] CDP tracking enabled (using JS fallback for events)")
+            logger.debug("CDP tracking enabled (using JS fallback for events)")
             
         except Exception as e:
-            print(f"[BrowserResponseInterceptor] CDP setup failed: {e}, using JS interception")
+            logger.warning("CDP setup failed: %s, using JS interception", e)
     
-    async def _setup_js_interception(self):
-        """Setup JavaScript-based interception with Stream Support."""
-        enable_script = """
-        (() => {
-            // Always reset for fresh state
-            window._flightSearchResponses = [];
-            window._allRequests = [];
-            window._interceptorsActive = true;
-            
-            const decoder = new TextDecoder("utf-8");
-
-            // INTERCEPT FETCH (Trip.com uses this for API requests)
-            const originalFetch = window.fetch;
-            window.fetch = async function(...args) {
-                const url = typeof args[0] === 'string' ? args[0] : args[0]?.url;
-                
-                // Log ALL requests for debugging
-                window._allRequests.push({
-                    url: url,
-                    timestamp: Date.now(),
-                    method: 'fetch'
-                });
-                console.log('[Interceptor] Fetch request:', url);
-                
-                const response = await originalFetch.apply(this, args);
-                
-                if (url && url.includes('FlightListSearchSSE')) {
-                    console.log('[Interceptor] ✓ MATCHED FlightListSearchSSE request!');
-                    
-                    // Clone response to avoid disrupting original flow
-                    const clonedResponse = response.clone();
-                    
-                    // Read stream in background (non-blocking)
-                    (async () => {
-                        try {
-                            const reader = clonedResponse.body.getReader();
-                            let fullBody = "";
-                            
-                            while (true) {
-                                const { done, value } = await reader.read();
-                                if (done) break;
-                                
-                                // Decode chunk data
-                                const chunk = decoder.decode(value, {stream: true});
-                                fullBody += chunk;
-                                
-                                // Update or create entry in global array
-                                const existingIndex = window._flightSearchResponses.findIndex(r => r.url === url);
-                                const entry = {
-                                    url: url,
-                                    status: response.status,
-                                    statusText: response.statusText,
-                                    body: fullBody,
-                                    timestamp: Date.now(),
-                                    type: 'fetch_stream',
-                                    isComplete: false
-                                };
-                                
-                                if (existingIndex >= 0) {
-                                    window._flightSearchResponses[existingIndex] = entry;
-                                } else {
-                                    window._flightSearchResponses.push(entry);
-                                }
-                                
-                                console.log('[Interceptor] Stream chunk received, total size:', fullBody.length);
-                            }
-                            
-                            // Mark as complete
-                            const finalIndex = window._flightSearchResponses.findIndex(r => r.url === url);
-                            if (finalIndex >= 0) {
-                                window._flightSearchResponses[finalIndex].isComplete = true;
-                                console.log('[Interceptor] ✓ Stream complete. Total size:', window._flightSearchResponses[finalIndex].body.length);
-                            }
-                            
-                        } catch (err) {
-                            console.error("[Interceptor] Stream reading error:", err);
-                        }
-                    })();
-                }
-                
-                return response;
-            };
-            
-            // INTERCEPT XMLHttpRequest (Backup method)
-            const XHR = XMLHttpRequest.prototype;
-            const originalOpen = XHR.open;
-            const originalSend = XHR.send;
-            
-            XHR.open = function(method, url, ...args) {
-                this._url = url;
-                this._method = method;
-                
-                // Log ALL requests for debugging
-                window._allRequests.push({
-                    url: url,
-                    timestamp: Date.now(),
-                    method: 'xhr'
-                });
-                console.log('[Interceptor] XHR request:', url);
-                
-                return originalOpen.call(this, method, url, ...args);
-            };
-            
-            XHR.send = function(...args) {
-                this.addEventListener('load', function() {
-                    if (this._url && this._url.includes('FlightListSearchSSE')) {
-                        console.log('[XHR-Interceptor] ✓ MATCHED FlightListSearchSSE!');
-                        window._flightSearchResponses.push({
-                            url: this._url,
-                            method: this._method,
-                            status: this.status,
-                            statusText: this.statusText,
-                            body: this.responseText,
-                            timestamp: Date.now(),
-                            type: 'xhr',
-                            isComplete: true
-                        });
-                        console.log('[XHR-Interceptor] Captured, size:', this.responseText.length);
-                    }
-                });
-                return originalSend.call(this, ...args);
-            };
-            
-            console.log('[Interceptor] ✓ Setup complete - monitoring ALL requests');
-            return 'JS Stream Interceptor Active';
-        })()
+    async def _install_js_interception(self):
         """
+        Register the fetch/XHR interceptor (with stream support) on the session's tab.
         
-        result = await self.browser_manager.execute_script(enable_script)
-        print(f"[BrowserResponseInterceptor] {result}")
+        The script is evaluated at the start of every new document, before any
+        page script runs, so it must be installed before navigating.
+        """
+        await self.browser_manager.add_binding('__flightDataReady', self._on_response_ready)
+        await self.browser_manager.add_init_script(_INTERCEPTOR_SCRIPT)
+        logger.debug("JS Stream Interceptor registered")
+
+    def _on_response_ready(self, payload: str):
+        """Handle the page's __flightDataReady(...) call for a completed capture."""
+        self._response_ready.set()
 
     async def _on_response_received(self, event):
         """Handle Network.responseReceived CDP event."""
@@ -223,7 +289,7 @@ class BrowserResponseInterceptor:
             request_id = event.get('requestId')
             
             if 'FlightListSearchSSE' in url:
-                print(f"[BrowserResponseInterceptor] Detected FlightListSearchSSE request: {request_id}")
+                logger.debug("Detected FlightListSearchSSE request: %s", request_id)
                 self.request_id_map[request_id] = {
                     'url': url,
                     'status': response.get('status'),
@@ -233,7 +299,7 @@ class BrowserResponseInterceptor:
                     'timestamp': event.get('timestamp')
                 }
         except Exception as e:
-            print(f"[BrowserResponseInterceptor] Error in _on_response_received: {e}")
+            logger.warning("Error in _on_response_received: %s", e)
     
     async def _on_loading_finished(self, event):
         """Handle Network.loadingFinished CDP event."""
@@ -241,7 +307,7 @@ class BrowserResponseInterceptor:
             request_id = event.get('requestId')
             
             if request_id in self.request_id_map:
-                print(f"[BrowserResponseInterceptor] Loading finished for FlightListSearchSSE: {request_id}")
+                logger.debug("Loading finished for FlightListSearchSSE: %s", request_id)
                 
                 # Get response body
                 try:
@@ -251,68 +317,48 @@ class BrowserResponseInterceptor:
                     body = result.get('body', '')
                     is_base64 = result.get('base64Encoded', False)
                     
-                    if is_base64:
-                        body = base64.b64decode(body).decode('utf-8', errors='ignore')
+                    body = base64.b64decode(body) if is_base64 else body.encode()
                     
                     response_info = self.request_id_map[request_id]
                     response_info['body'] = body
                     
                     self.captured_responses.append(response_info)
-                    print(f"[BrowserResponseInterceptor] ✓ CDP captured response body (length: {len(body)} bytes)") 
+                    logger.debug("✓ CDP captured response body (length: %s bytes)", len(body))
                     
                 except Exception as e:
-                    print(f"[BrowserResponseInterceptor] Error getting response body: {e}")
+                    logger.warning("Error getting response body: %s", e)
                     
         except Exception as e:
-            print(f"[BrowserResponseInterceptor] Error in _on_loading_finished: {e}")
+            logger.warning("Error in _on_loading_finished: %s", e)
     
     async def _wait_for_response(self, timeout: int):
         start_time = asyncio.get_event_loop().time()
-        check_interval = 0.5  # Check every 500ms
+        # Completed captures wake the loop at once; polling only covers streams still in progress
+        check_interval = 2.0
         check_count = 0
+        last_size = -1
+        fetched_size = -1
         
         while asyncio.get_event_loop().time() - start_time < timeout:
             check_count += 1
             
             # Check CDP captured responses first (if implemented)
             if self.captured_responses:
-                print(f"[BrowserResponseInterceptor] Found {len(self.captured_responses)} CDP captured response(s)")
+                logger.debug("Found %s CDP captured response(s)", len(self.captured_responses))
                 response_data = self.captured_responses[-1]
                 self.flight_data = self._parse_response(response_data)
                 self.response_captured = True
                 return
             
-            # Check JS-captured responses with stream support
-            check_script = """
-            (() => {
-                // Debug: Log what we have
-                console.log('[Interceptor-Check] window._flightSearchResponses:', window._flightSearchResponses?.length || 0);
-                
-                if (window._flightSearchResponses && window._flightSearchResponses.length > 0) {
-                    const last = window._flightSearchResponses[window._flightSearchResponses.length - 1];
-                    console.log('[Interceptor-Check] Last response size:', last.body?.length || 0);
-                    
-                    // Return if body has meaningful data (> 500 chars)
-                    if (last.body && last.body.length > 500) {
-                        return JSON.stringify({
-                            url: last.url,
-                            status: last.status,
-                            statusText: last.statusText,
-                            body: last.body,
-                            timestamp: last.timestamp,
-                            type: last.type
-                        });
-                    }
-                }
-                return null;
-            })()
-            """
+            # Clear before checking so a completion signalled during the check is not lost
+            self._response_ready.clear()
             
             try:
-                result = await self.browser_manager.execute_script(check_script)
+                result = await self.browser_manager.execute_script(_STATUS_SCRIPT)
+                ready = False
                 
-                # Every 10 checks (5 seconds), print debug info
-                if check_count % 10 == 0:
+                # Every 10 checks, log debug info (skip the extra round-trip unless it will be shown)
+                if check_count % 10 == 0 and logger.isEnabledFor(logging.DEBUG):
                     debug_script = """
                     (() => {
                         if (window._flightSearchResponses) {
@@ -320,7 +366,7 @@ class BrowserResponseInterceptor:
                                 count: window._flightSearchResponses.length,
                                 responses: window._flightSearchResponses.map(r => ({
                                     url: r.url.substring(r.url.lastIndexOf('/') + 1),
-                                    bodySize: r.body?.length || 0,
+                                    bodySize: r.bodyLength || 0,
                                     type: r.type
                                 }))
                             };
@@ -330,50 +376,164 @@ class BrowserResponseInterceptor:
                     """
                     try:
                         debug_info = await self.browser_manager.execute_script(debug_script)
-                        print(f"[BrowserResponseInterceptor] Check #{check_count}: {debug_info}")
+                        logger.debug("Check #%s: %s", check_count, debug_info)
                     except RuntimeError as e:
-                        print(f"[BrowserResponseInterceptor] Browser disconnected during check: {e}")
+                        logger.warning("Browser disconnected during check: %s", e)
                         raise TimeoutError(f"Browser connection lost")
                 
                 if result and result != 'null':
-                    response_data = json.loads(result)
-                    print(f"[BrowserResponseInterceptor] ✓ JS captured stream data. Size: {len(response_data['body'])} bytes")
+                    status = json_utils.loads(result)
+                    size = status['size']
+                    
+                    # Pull the body across only once it has meaningful data (> 500 chars)
+                    # and has either finished or stopped growing since the last check
+                    ready = size > 500 and (status['isComplete'] or size == last_size) and size != fetched_size
+                    last_size = size
+                
+                if ready:
+                    response_data = await self._fetch_last_response()
+                    fetched_size = len(response_data['body'])
+                    logger.debug("✓ JS captured stream data. Size: %s bytes", fetched_size)
                     
                     # Parse the response
                     self.flight_data = self._parse_response(response_data)
                     
                     # Check if we have actual flight data
-                    response_str = str(self.flight_data)
-                    if "flightList" in response_str or "itineraryList" in response_str or "basicInfo" in response_str:
-                        print("[BrowserResponseInterceptor] ✓ Flight data found in response")
-                        print("[BrowserResponseInterceptor] Waiting 10 seconds for additional SSE events...")
+                    body = response_data['body']
+                    if any(marker in body for marker in _FLIGHT_DATA_MARKERS):
+                        logger.debug("✓ Flight data found in response")
+                        # Let the stream finish (or settle) so later SSE events are included
+                        final_size = fetched_size
+                        if not status['isComplete']:
+                            logger.debug("Waiting for additional SSE events...")
+                            final_size = await self._wait_for_stream_end(fetched_size)
                         
-                        # Wait 10 seconds to collect any additional SSE responses
-                        initial_size = len(response_data['body'])
-                        await asyncio.sleep(10)
-                        
-                        # Check if more data arrived
-                        final_check = await self.browser_manager.execute_script(check_script)
-                        if final_check and final_check != 'null':
-                            final_data = json.loads(final_check)
-                            if len(final_data['body']) > initial_size:
-                                print(f"[BrowserResponseInterceptor] ✓ Collected additional data: {len(final_data['body']) - initial_size} bytes")
-                                self.flight_data = self._parse_response(final_data)
-                            else:
-                                print(f"[BrowserResponseInterceptor] No additional data received")
+                        if final_size > fetched_size:
+                            final_data = await self._fetch_last_response()
+                            logger.debug("✓ Collected additional data: %s bytes", len(final_data['body']) - fetched_size)
+                            self.flight_data = self._parse_response(final_data)
+                        else:
+                            logger.debug("No additional data received")
                         
                         self.response_captured = True
                         return
                     else:
-                        print("[BrowserResponseInterceptor] Waiting for complete flight data...")
+                        logger.debug("Waiting for complete flight data...")
             
             except Exception as e:
-                print(f"[BrowserResponseInterceptor] Error checking responses: {e}")
+                logger.warning("Error checking responses: %s", e)
                 
-            await asyncio.sleep(check_interval)
+            try:
+                await asyncio.wait_for(self._response_ready.wait(), check_interval)
+            except asyncio.TimeoutError:
+                pass
             
         raise TimeoutError(f"FlightListSearchSSE response not captured within {timeout} seconds")
 
+    async def _wait_for_stream_end(self, size: int, max_wait: float = 10) -> int:
+        """
+        Wait until the captured response completes or stops growing.
+        
+        Args:
+            size: Body size already seen, in bytes
+            max_wait: Upper bound on the wait in seconds (default: 10)
+            
+        Returns:
+            The last observed body size
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_wait
+        stable_checks = 0
+        
+        while stable_checks < 3 and loop.time() < deadline:
+            # A completion signal from the page ends the 250ms wait early
+            self._response_ready.clear()
+            try:
+                await asyncio.wait_for(self._response_ready.wait(), 0.25)
+            except asyncio.TimeoutError:
+                pass
+            
+            result = await self.browser_manager.execute_script(_STATUS_SCRIPT)
+            if not result or result == 'null':
+                break
+            status = json_utils.loads(result)
+            if status['isComplete']:
+                return status['size']
+            
+            if status['size'] == size:
+                stable_checks += 1
+            else:
+                size = status['size']
+                stable_checks = 0
+        
+        return size
+
+    async def _fetch_last_response(self) -> Dict[str, Any]:
+        """Fetch the most recent captured response from the page, with its body as bytes."""
+        response_data = json_utils.loads(await self.browser_manager.execute_script(_FETCH_SCRIPT))
+        response_data['body'] = base64.b64decode(response_data.pop('bodyB64'))
+        return response_data
+
+    def _reset_parse_state(self):
+        """Forget the SSE events parsed so far."""
+        self._parsed_url = None
+        self._parsed_offset = 0
+        self._parsed_marker = b''
+        self._tail_event_count = 0
+        self._sse_events = []
+        self._saw_data = False
+
+    def _continues_parsed_body(self, response_data: Dict[str, Any], body: bytes) -> bool:
+        """Whether `body` is a longer copy of the SSE body parsed last time."""
+        offset = self._parsed_offset
+        return (
+            self._saw_data
+            and response_data.get('url') == self._parsed_url
+            and len(body) >= offset
+            and body[max(offset - 64, 0):offset] == self._parsed_marker
+        )
+
+    @staticmethod
+    def _parse_sse_lines(data: bytes, events: List[Any]) -> bool:
+        """
+        Append the payloads of the SSE `data:` lines in `data` to `events`.
+        
+        Returns:
+            True if at least one data line was found
+        """
+        events_append = events.append
+        loads = json_utils.loads
+        decode_error = json_utils.JSONDecodeError
+        current_event = {}
+        saw_data = False
+        
+        # Split the raw bytes: only \n, \r and \r\n end a line, so a U+2028 inside
+        # a JSON string does not split its event
+        for line in data.splitlines():
+            if line.startswith(b'data:'):
+                saw_data = True
+                payload = line[5:].strip()
+                try:
+                    events_append(loads(payload))
+                except decode_error:
+                    events_append(payload.decode('utf-8', errors='replace'))
+            elif not line:
+                if current_event:
+                    current_event = {}
+            elif line.startswith(b'event:'):
+                current_event['event'] = line[6:].strip().decode('utf-8', errors='replace')
+            elif line.startswith(b'id:'):
+                current_event['id'] = line[3:].strip().decode('utf-8', errors='replace')
+        
+        return saw_data
+
+    @staticmethod
+    def _preview(body: bytes) -> str:
+        """Decode at most the first 1000 bytes of `body` for display."""
+        if len(body) > 1000:
+            return body[:1000].decode('utf-8', errors='ignore') + '...'
+        return body.decode('utf-8', errors='replace')
+
     def _parse_response(self, response_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Parse intercepted response data.
@@ -381,39 +541,42 @@ class BrowserResponseInterceptor:
         Handles both SSE (Server-Sent Events) format and regular JSON responses.
         
         Args:
-            response_data: Raw response data from browser
+            response_data: Raw response data from browser, with the body as bytes
             
         Returns:
             Parsed response dictionary
         """
-        body = response_data.get('body', '')
+        body = response_data.get('body', b'')
         
-        print(f"[BrowserResponseInterceptor] Parsing response body (length: {len(body)})")
+        logger.debug("Parsing response body (length: %s)", len(body))
         
-        # Parse SSE format (data: lines)
-        if 'data:' in body:
+        # Parse SSE format (data: lines); fall back to JSON if there are none. When the
+        # body extends the one parsed last time, only the new lines are parsed
+        if self._continues_parsed_body(response_data, body):
+            start = self._parsed_offset
+            events = self._sse_events
+            # The previous trailing partial line is re-parsed now that it may be complete
+            if self._tail_event_count:
+                del events[-self._tail_event_count:]
+        else:
+            start = 0
             events = []
-            current_event = {}
-            
-            for line in body.split('\n'):
-                line = line.strip()
-                
-                if line.startswith('data:'):
-                    data_str = line[5:].strip()
-                    try:
-                        event_data = json.loads(data_str)
-                        events.append(event_data)
-                    except json.JSONDecodeError:
-                        events.append(data_str)
-                elif line.startswith('event:'):
-                    current_event['event'] = line[6:].strip()
-                elif line.startswith('id:'):
-                    current_event['id'] = line[3:].strip()
-                elif line == '':
-                    if current_event:
-                        current_event = {}
-            
-            print(f"[BrowserResponseInterceptor] Parsed {len(events)} SSE events")
+        
+        # Lines up to the last '\n' are complete; anything after it may still be growing
+        end = max(body.rfind(b'\n') + 1, start)
+        saw_data = self._parse_sse_lines(body[start:end], events)
+        complete_count = len(events)
+        saw_data = self._parse_sse_lines(body[end:], events) or saw_data
+        
+        self._parsed_url = response_data.get('url')
+        self._parsed_offset = end
+        self._parsed_marker = body[max(end - 64, 0):end]
+        self._tail_event_count = len(events) - complete_count
+        self._sse_events = events
+        self._saw_data = saw_data = saw_data or start > 0
+        
+        if saw_data:
+            logger.debug("Parsed %s SSE events", len(events))
             
             return {
                 'status': 'success',
@@ -421,29 +584,29 @@ class BrowserResponseInterceptor:
                 'statusCode': response_data.get('status'),
                 'events': events,
                 'eventCount': len(events),
-                'raw': body[:1000] + '...' if len(body) > 1000 else body,  # Truncate for readability
+                'raw': self._preview(body),  # Truncate for readability
+                'fullBodyLength': len(body),
+                'timestamp': response_data.get('timestamp')
+            }
+        
+        # Try to parse as JSON
+        try:
+            data = json_utils.loads(body)
+            logger.debug("Parsed as JSON")
+            return {
+                'status': 'success',
+                'url': response_data.get('url'),
+                'statusCode': response_data.get('status'),
+                'data': data,
+                'timestamp': response_data.get('timestamp')
+            }
+        except json_utils.JSONDecodeError:
+            logger.debug("Unable to parse as JSON, returning raw")
+            return {
+                'status': 'success',
+                'url': response_data.get('url'),
+                'statusCode': response_data.get('status'),
+                'raw': self._preview(body),
                 'fullBodyLength': len(body),
                 'timestamp': response_data.get('timestamp')
             }
-        else:
-            # Try to parse as JSON
-            try:
-                data = json.loads(body)
-                print(f"[BrowserResponseInterceptor] Parsed as JSON")
-                return {
-                    'status': 'success',
-                    'url': response_data.get('url'),
-                    'statusCode': response_data.get('status'),
-                    'data': data,
-                    'timestamp': response_data.get('timestamp')
-                }
-            except json.JSONDecodeError:
-                print(f"[BrowserResponseInterceptor] Unable to parse as JSON, returning raw")
-                return {
-                    'status': 'success',
-                    'url': response_data.get('url'),
-                    'statusCode': response_data.get('status'),
-                    'raw': body[:1000] + '...' if len(body) > 1000 else body,
-                    'fullBodyLength': len(body),
-                    'timestamp': response_data.get('timestamp')
-                }
@@ -1,11 +1,46 @@
 """Cookie extraction service for Trip.com scraping."""
 
-import asyncio
 import json
+import os
+import random
+import time
 from typing import Dict, Any, Optional
-from urllib.parse import urlparse
+from urllib.parse import urlparse, quote, unquote
 import uuid
 
+from src.config import BROWSER_WAIT_TIMEOUT
+from src.services.ubt_manager import UBTManager
+
+# Cookies copied through as-is when the site has set them
+_IMPORTANT_COOKIES = (
+    'ibusite', 'ibugroup', 'ibu_country', 'ibu_cookie_strict',
+    'ibulanguage', 'ibulocale', 'cookiePricesDisplayed',
+    '_RGUID', '_RSG', '_RDG', '_RF1', 'ibu_flt_pref_cfg'
+)
+
+# Cookies sent verbatim in the Cookie header, in order
+_HEADER_COOKIES = (
+    'GUID', 'UBT_VID', '_abtest_userid', '_RGUID',
+    'ibusite', 'ibugroup', 'ibu_country', 'ibulanguage',
+    'ibulocale', 'cookiePricesDisplayed', '_RF1',
+    'ibu_flt_pref_cfg'
+)
+
+# Parses document.cookie in the page, returning only whitelisted cookies
+_COOKIES_SCRIPT = """
+(() => {
+    const wanted = new Set(%s);
+    const cookies = {};
+    for (const cookie of document.cookie.split(';')) {
+        const [name, value] = cookie.trim().split('=');
+        if (name && value && wanted.has(name)) {
+            cookies[name] = decodeURIComponent(value);
+        }
+    }
+    return cookies;
+})()
+""" % json.dumps(['GUID', 'UBT_VID', '_combined', '_abtest_userid', *_IMPORTANT_COOKIES])
+
 
 class CookieExtractor:
     """Extracts and manages cookies from Trip.com browser sessions."""
@@ -36,25 +71,15 @@ class CookieExtractor:
         
         print(f"[CookieExtractor] Visiting root URL: {root_url}")
         
-        # Navigate to root to get cookies
+        # Navigate to root to get cookies; the GUID cookie is set by page scripts
         await self.browser_manager.navigate_to_url(root_url)
-        await asyncio.sleep(3)
-        
-        # Extract cookies from browser
-        cookies_script = """
-        (() => {
-            const cookies = {};
-            document.cookie.split(';').forEach(cookie => {
-                const [name, value] = cookie.trim().split('=');
-                if (name && value) {
-                    cookies[name] = decodeURIComponent(value);
-                }
-            });
-            return cookies;
-        })()
-        """
+        await self.browser_manager.wait_for_condition(
+            "document.cookie.includes('GUID=')",
+            timeout=BROWSER_WAIT_TIMEOUT,
+        )
         
-        browser_cookies = await self.browser_manager.execute_script(cookies_script)
+        # Extract only the cookies used below from the browser
+        browser_cookies = await self.browser_manager.execute_script(_COOKIES_SCRIPT)
         
         # Extract important cookies
         cookies = {}
@@ -71,10 +96,8 @@ class CookieExtractor:
             cookies['UBT_VID'] = browser_cookies['UBT_VID']
         else:
             # Generate format: timestamp.randomstring
-            import time
-            timestamp = int(time.time() * 1000)
-            random_str = uuid.uuid4().hex[:12]
-            cookies['UBT_VID'] = f"{timestamp}.{random_str}"
+            timestamp = time.time_ns() // 1_000_000
+            cookies['UBT_VID'] = f"{timestamp}.{os.urandom(6).hex()}"
         
         # _combined cookie parsing
         if '_combined' in browser_cookies:
@@ -84,13 +107,7 @@ class CookieExtractor:
             cookies['_combined'] = self._generate_combined_cookie()
         
         # Other important cookies
-        important_cookies = [
-            'ibusite', 'ibugroup', 'ibu_country', 'ibu_cookie_strict',
-            'ibulanguage', 'ibulocale', 'cookiePricesDisplayed',
-            '_RGUID', '_RSG', '_RDG', '_RF1', 'ibu_flt_pref_cfg'
-        ]
-        
-        for cookie_name in important_cookies:
+        for cookie_name in _IMPORTANT_COOKIES:
             if cookie_name in browser_cookies:
                 cookies[cookie_name] = browser_cookies[cookie_name]
         
@@ -118,17 +135,16 @@ class CookieExtractor:
             **cookies,
             'headers': headers,
             'allCookies': browser_cookies,
+            # The cookies do not change during a scrape, so build the header once
+            'cookieHeader': self.get_cookie_header(cookies),
         }
     
     def _generate_guid(self) -> str:
         """Generate GUID format: 14 digits."""
-        import random
-        return ''.join([str(random.randint(0, 9)) for _ in range(14)])
+        return f"{random.randrange(10 ** 14):014d}"
     
     def _parse_combined_cookie(self, combined_value: str) -> Dict[str, str]:
         """Parse _combined cookie value."""
-        from urllib.parse import unquote
-        
         decoded = unquote(combined_value)
         parts = decoded.split('&')
         
@@ -142,12 +158,7 @@ class CookieExtractor:
     
     def _generate_combined_cookie(self) -> Dict[str, str]:
         """Generate _combined cookie if not present."""
-        import time
-        from datetime import datetime
-        
-        now = datetime.now()
-        timestamp = now.strftime('%Y%m%d%H%M%S%f')[:-3]  # YYYYMMDDHHMMSSmmm
-        transaction_id = f"1-mf-{timestamp}-WEB"
+        transaction_id = UBTManager._generate_transaction_id()
         page_id = '10320667452'
         
         return {
@@ -167,24 +178,14 @@ class CookieExtractor:
         Returns:
             Cookie header string
         """
-        cookie_parts = []
-        
         # Add simple cookies
-        simple_cookies = ['GUID', 'UBT_VID', '_abtest_userid', '_RGUID', 
-                         'ibusite', 'ibugroup', 'ibu_country', 'ibulanguage',
-                         'ibulocale', 'cookiePricesDisplayed', '_RF1',
-                         'ibu_flt_pref_cfg']
-        
-        for name in simple_cookies:
-            if name in cookies and cookies[name]:
-                cookie_parts.append(f"{name}={cookies[name]}")
+        cookie_parts = [f"{name}={cookies[name]}" for name in _HEADER_COOKIES if cookies.get(name)]
         
         # Add _combined cookie
         if '_combined' in cookies:
             combined = cookies['_combined']
             if isinstance(combined, dict):
                 # Rebuild _combined string
-                from urllib.parse import quote
                 raw = '&'.join([f"{k}={v}" for k, v in combined.items()])
                 encoded = quote(raw, safe='')
                 cookie_parts.append(f"_combined={encoded}")
@@ -1,22 +1,87 @@
 """Flight scraper service for Trip.com API."""
 
+import io
 import json
-import asyncio
 from typing import Dict, Any, Optional
 
-from src.core.browser_manager import BrowserManager
+import aiohttp
+
+from src.core.browser_manager import BrowserManager, BrowserPool
 from src.services.cookie_extractor import CookieExtractor
 from src.services.flight_url_parser import FlightSearchURLParser
 from src.services.ubt_manager import UBTManager
 from src.services.w_payload_service import generate_w_payload
 from src.services.x_ctx_service import generate_x_ctx_header
 from src.models.w_payload_models import WPayload
+from src.models.search_models import ParsedURL
+from src.utils import json_utils
+from src.config import TOKEN_GENERATION_TIMEOUT
+
+# The search page defines its signing functions asynchronously after load
+_SIGNING_READY = "typeof window.signature === 'function' && typeof window.c_sign !== 'undefined'"
+
+# Installed on every document of the scrape tab so token extraction only has
+# to send its arguments rather than a full script per call
+_BOOTSTRAP_SCRIPT = """
+window.__scraper = {
+    getSignature(input) {
+        try {
+            if (typeof window.signature === 'function') {
+                return window.signature(input);
+            }
+            return "ERROR: window.signature not found";
+        } catch (err) {
+            return "ERROR: " + err.toString();
+        }
+    },
+    
+    getWSource(hash) {
+        try {
+            return window.c_sign.toString(hash);
+        } catch (e) {
+            return "ERROR: " + e.toString();
+        }
+    },
+    
+    getToken() {
+        try {
+            // Try to get token from various possible locations
+            if (window.__token) return window.__token;
+            if (window.token) return window.token;
+            if (window._token) return window._token;
+            
+            // Try to get from local storage
+            const tokenFromStorage = localStorage.getItem('token') || localStorage.getItem('__token');
+            if (tokenFromStorage) return tokenFromStorage;
+            
+            return "TOKEN_NOT_FOUND";
+        } catch (e) {
+            return "ERROR: " + e.toString();
+        }
+    },
+    
+    getTokens(input, hash) {
+        return {
+            signature: this.getSignature(input),
+            w_payload_source: this.getWSource(hash),
+            token: this.getToken(),
+        };
+    },
+};
+"""
 
 
 class FlightScraper:
     """Main service for scraping Trip.com flight search API."""
     
-    def __init__(self):
+    def __init__(
+        self,
+        browser_pool: Optional[BrowserPool] = None,
+        http_session: Optional[aiohttp.ClientSession] = None,
+    ):
+        self.browser_pool = browser_pool
+        # Shared pooled session for any request made outside the browser
+        self.http_session = http_session
         self.browser_manager = None
         self.cookie_extractor = None
     
@@ -37,39 +102,46 @@ class FlightScraper:
             
             # Step 2: Initialize browser
             print(f"[FlightScraper] Initializing browser...")
-            self.browser_manager = BrowserManager()
+            self.browser_manager = BrowserManager(self.browser_pool)
             await self.browser_manager.create_session()
+            await self.browser_manager.add_init_script(_BOOTSTRAP_SCRIPT)
             
             # Step 3: Extract cookies from hostname
             self.cookie_extractor = CookieExtractor(self.browser_manager)
             cookies = await self.cookie_extractor.get_cookies_from_hostname(
-                hostname=parsed['hostname'],
-                region=parsed['region'],
-                locale=parsed['params']['locale'],
-                currency=parsed['params']['curr']
+                hostname=parsed.hostname,
+                region=parsed.region,
+                locale=parsed.params.locale,
+                currency=parsed.params.curr
             )
+            # One UBT manager per scrape keeps tracking IDs consistent across
+            # the token payload, search payload and headers
+            ubt_manager = UBTManager(cookies)
             
             # Step 4: Navigate to search URL
             print(f"[FlightScraper] Navigating to search URL...")
             await self.browser_manager.navigate_to_url(url)
-            await asyncio.sleep(5)
+            await self.browser_manager.wait_for_condition(
+                _SIGNING_READY,
+                timeout=TOKEN_GENERATION_TIMEOUT,
+            )
             
             # Step 5: Extract tokens from browser
             print(f"[FlightScraper] Extracting tokens...")
-            tokens = await self._extract_tokens(parsed, cookies)
+            tokens = await self._extract_tokens(parsed, cookies, ubt_manager)
             
             # Step 6: Build request payload
             print(f"[FlightScraper] Building request payload...")
-            payload = self._build_flight_search_payload(parsed, cookies, tokens)
+            payload = self._build_flight_search_payload(parsed, cookies, tokens, ubt_manager)
             
             # Step 7: Build headers
             print(f"[FlightScraper] Building headers...")
-            headers = self._build_request_headers(parsed, cookies, tokens)
+            headers = self._build_request_headers(parsed, cookies, tokens, ubt_manager)
             
             # Step 8: Make API request via browser
             print(f"[FlightScraper] Making API request...")
             response = await self._make_api_request(
-                parsed['hostname'],
+                parsed.sse_url,
                 payload,
                 headers,
                 cookies
@@ -85,72 +157,25 @@ class FlightScraper:
             if self.browser_manager:
                 await self.browser_manager.close()
     
-    async def _extract_tokens(self, parsed: Dict[str, Any], cookies: Dict[str, Any]) -> Dict[str, str]:
+    async def _extract_tokens(self, parsed: ParsedURL, cookies: Dict[str, Any], ubt_manager: UBTManager) -> Dict[str, str]:
         """Extract all required tokens from browser."""
-        ubt_manager = UBTManager(cookies)
         batch_id = ubt_manager.get_batch_id()
         
         # Build payload for token generation
-        token_payload = self._build_token_payload(parsed, cookies, batch_id)
-        
-        # Extract signature token from browser
-        input_token = json.dumps(token_payload)
-        signature_script = f"""
-        (() => {{
-            try {{
-                if (typeof window.signature === 'function') {{
-                    return window.signature({input_token});
-                }} else {{
-                    return "ERROR: window.signature not found";
-                }}
-            }} catch (err) {{
-                return "ERROR: " + err.toString();
-            }}
-        }})()
-        """
-        
-        signature = await self.browser_manager.execute_script(signature_script)
+        token_payload = self._build_token_payload(parsed, cookies, batch_id, ubt_manager)
         
-        # Generate W payload
-        w_payload_dict, w_payload_md5 = generate_w_payload(token_payload)
-        
-        # Extract w-payload-source from browser
-        w_payload_script = f"""
-        (() => {{
-            try {{
-                return window.c_sign.toString({json.dumps(w_payload_md5)});
-            }} catch (e) {{
-                return "ERROR: " + e.toString();
-            }}
-        }})()
-        """
-        
-        w_payload_source = await self.browser_manager.execute_script(w_payload_script)
-        
-        # Generate X-CTX header
+        # Generate W payload and X-CTX header locally
+        w_payload, w_payload_md5 = generate_w_payload(token_payload)
         x_ctx = generate_x_ctx_header(token_payload)
         
-        # Extract main token from browser
-        token_script = """
-        (() => {
-            try {
-                // Try to get token from various possible locations
-                if (window.__token) return window.__token;
-                if (window.token) return window.token;
-                if (window._token) return window._token;
-                
-                // Try to get from local storage
-                const tokenFromStorage = localStorage.getItem('token') || localStorage.getItem('__token');
-                if (tokenFromStorage) return tokenFromStorage;
-                
-                return "TOKEN_NOT_FOUND";
-            } catch (e) {
-                return "ERROR: " + e.toString();
-            }
-        })()
-        """
+        # Extract signature, w-payload-source and main token in one round-trip
+        input_token = json_utils.dumps(token_payload).decode()
+        tokens_script = f"window.__scraper.getTokens({input_token}, {json.dumps(w_payload_md5)})"
         
-        main_token = await self.browser_manager.execute_script(token_script)
+        browser_tokens = await self.browser_manager.execute_script(tokens_script)
+        signature = browser_tokens['signature']
+        w_payload_source = browser_tokens['w_payload_source']
+        main_token = browser_tokens['token']
         
         return {
             'signature': signature,
@@ -160,14 +185,13 @@ class FlightScraper:
             'batch_id': batch_id,
         }
     
-    def _build_token_payload(self, parsed: Dict[str, Any], cookies: Dict[str, Any], batch_id: str) -> Dict[str, Any]:
+    def _build_token_payload(self, parsed: ParsedURL, cookies: Dict[str, Any], batch_id: str, ubt_manager: UBTManager) -> Dict[str, Any]:
         """Build payload for token generation."""
-        params = parsed['params']
-        ubt_manager = UBTManager(cookies)
+        params = parsed.params
         
         journey_infos = FlightSearchURLParser.build_journey_info(params)
-        trip_type = FlightSearchURLParser.get_trip_type_code(params['triptype'])
-        cabin_class = FlightSearchURLParser.get_cabin_class_code(params['class'])
+        trip_type = FlightSearchURLParser.get_trip_type_code(params.triptype)
+        cabin_class = FlightSearchURLParser.get_cabin_class_code(params.cabin_class)
         
         return {
             'mode': 0,
@@ -177,9 +201,9 @@ class FlightScraper:
                 'tripType': trip_type,
                 'journeyNo': 1,
                 'passengerInfoType': {
-                    'adultCount': params['quantity'],
-                    'childCount': params['childqty'],
-                    'infantCount': params['babyqty'],
+                    'adultCount': params.quantity,
+                    'childCount': params.childqty,
+                    'infantCount': params.babyqty,
                 },
                 'journeyInfoTypes': journey_infos,
                 'policyId': None,
@@ -212,49 +236,48 @@ class FlightScraper:
                 'auth': '',
                 'xsid': '',
                 'extension': ubt_manager.build_extension_list(params, batch_id),
-                'Locale': params['locale'],
-                'Language': params['locale'].split('-')[0],
-                'Currency': params['curr'],
+                'Locale': params.locale,
+                'Language': params.language,
+                'Currency': params.curr,
                 'ClientID': '',
                 'appid': '700020',
             },
         }
     
-    def _build_flight_search_payload(self, parsed: Dict[str, Any], cookies: Dict[str, Any], tokens: Dict[str, str]) -> Dict[str, Any]:
+    def _build_flight_search_payload(self, parsed: ParsedURL, cookies: Dict[str, Any], tokens: Dict[str, str], ubt_manager: UBTManager) -> Dict[str, Any]:
         """Build full flight search payload."""
-        return self._build_token_payload(parsed, cookies, tokens['batch_id'])
+        return self._build_token_payload(parsed, cookies, tokens['batch_id'], ubt_manager)
     
-    def _build_request_headers(self, parsed: Dict[str, Any], cookies: Dict[str, Any], tokens: Dict[str, str]) -> Dict[str, str]:
+    def _build_request_headers(self, parsed: ParsedURL, cookies: Dict[str, Any], tokens: Dict[str, str], ubt_manager: UBTManager) -> Dict[str, str]:
         """Build all request headers."""
-        params = parsed['params']
-        ubt_manager = UBTManager(cookies)
-        cookie_header = self.cookie_extractor.get_cookie_header(cookies)
+        params = parsed.params
         
         headers = {
             'accept': 'text/event-stream',
             'accept-language': 'en-US,en;q=0.9',
             'content-type': 'application/json; charset=utf-8',
-            'cookie': cookie_header,
-            'cookieorigin': f"https://{parsed['hostname']}",
-            'currency': params['curr'].upper(),
-            'locale': params['locale'],
-            'origin': f"https://{parsed['hostname']}",
+            'cookie': cookies['cookieHeader'],
+            'cookieorigin': parsed.origin,
+            'currency': params.curr.upper(),
+            'locale': params.locale,
+            'origin': parsed.origin,
             'priority': 'u=1, i',
-            'referer': parsed['url'],
+            'referer': parsed.url,
             'token': tokens.get('token', ''),
             'w-payload-source': tokens['w_payload_source'],
-            'x-ctx-country': parsed['region'].upper(),
-            'x-ctx-currency': params['curr'].upper(),
-            'x-ctx-locale': params['locale'],
+            'x-ctx-country': parsed.region.upper(),
+            'x-ctx-currency': params.curr.upper(),
+            'x-ctx-locale': params.locale,
             'x-ctx-wclient-req': tokens['x_ctx_wclient_req'],
             **ubt_manager.build_ubt_headers(),
         }
         
         return headers
     
-    async def _make_api_request(self, hostname: str, payload: Dict[str, Any], headers: Dict[str, str], cookies: Dict[str, Any]) -> Any:
+    async def _make_api_request(self, api_url: str, payload: Dict[str, Any], headers: Dict[str, str], cookies: Dict[str, Any]) -> Any:
         """Make API request to FlightListSearchSSE via browser fetch."""
-        api_url = f"https://{hostname}/restapi/soa2/27015/FlightListSearchSSE"
+        # Serialize the body once; the script embeds it as a JS string literal
+        body_str = json_utils.dumps(payload).decode()
         
         # Use browser's fetch API to make the request
         fetch_script = f"""
@@ -262,8 +285,8 @@ class FlightScraper:
             try {{
                 const response = await fetch({json.dumps(api_url)}, {{
                     method: 'POST',
-                    headers: {json.dumps(headers)},
-                    body: {json.dumps(json.dumps(payload))},
+                    headers: {json_utils.dumps(headers).decode()},
+                    body: {json.dumps(body_str)},
                 }});
                 
                 const text = await response.text();
@@ -290,12 +313,22 @@ class FlightScraper:
         else:
             raise Exception(f"API request failed: {result.get('error', 'Unknown error')}")
     
-    def _parse_sse_response(self, sse_text: str) -> Dict[str, Any]:
-        """Parse Server-Sent Events response."""
+    def _parse_sse_response(self, sse_text: str, include_raw: bool = False) -> Dict[str, Any]:
+        """
+        Parse Server-Sent Events response.
+        
+        Args:
+            sse_text: Raw SSE response body
+            include_raw: Also return the unparsed body under 'raw'
+            
+        Returns:
+            Dictionary with the parsed events
+        """
         events = []
         current_event = {}
         
-        for line in sse_text.split('\n'):
+        # Iterate lazily rather than materializing every line up front
+        for line in io.StringIO(sse_text):
             line = line.strip()
             
             if not line:
@@ -309,14 +342,15 @@ class FlightScraper:
             elif line.startswith('data:'):
                 data_str = line[5:].strip()
                 try:
-                    current_event['data'] = json.loads(data_str)
-                except:
+                    current_event['data'] = json_utils.loads(data_str)
+                except json_utils.JSONDecodeError:
                     current_event['data'] = data_str
         
         if current_event:
             events.append(current_event)
         
-        return {
-            'events': events,
-            'raw': sse_text,
-        }
+        result = {'events': events}
+        if include_raw:
+            result['raw'] = sse_text
+        
+        return result
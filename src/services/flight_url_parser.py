@@ -1,22 +1,42 @@
 """URL parser for Trip.com flight search URLs."""
 
+from functools import lru_cache
 from typing import Dict, Any, Optional
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlparse, parse_qsl
+
+from src.config import TRIP_SSE_ENDPOINT
+from src.models.search_models import SearchParams, ParsedURL
+
+_TRIPTYPE_CODES = {
+    'OW': 1,  # One Way
+    'RT': 2,  # Round Trip
+    'MT': 3,  # Multi-city
+}
+
+_CABIN_CLASS_CODES = {
+    'y': 1,  # Economy
+    'c': 4,  # Business
+    'f': 8,  # First
+}
 
 
 class FlightSearchURLParser:
     """Parses Trip.com flight search URLs to extract search parameters."""
     
     @staticmethod
-    def parse_url(url_string: str) -> Dict[str, Any]:
+    @lru_cache(maxsize=256)
+    def parse_url(url_string: str) -> ParsedURL:
         """
         Parse Trip.com flight search URL.
         
+        Results are cached per URL string; the returned ParsedURL is frozen, so
+        it is safe to share between callers.
+        
         Args:
             url_string: Full Trip.com search URL
             
         Returns:
-            Dictionary containing hostname, region, and search parameters
+            ParsedURL containing hostname, region, and search parameters
         """
         url = urlparse(url_string)
         hostname = url.hostname or 'id.trip.com'
@@ -25,41 +45,48 @@ class FlightSearchURLParser:
         host_parts = hostname.split('.')
         region = host_parts[0] if host_parts else 'id'
         
-        # Parse query parameters
-        query_params = parse_qs(url.query)
+        # Parse query parameters into a flat dict, keeping the first value of
+        # repeated keys and dropping blank ones (as parse_qs did)
+        query_params = {}
+        for key, value in parse_qsl(url.query):
+            query_params.setdefault(key, value)
+        get_param = query_params.get
+        
+        locale = get_param('locale', f'en-{region.upper()}')
         
-        # Helper to get first value from query params list
-        def get_param(key: str, default: Any = None) -> Any:
-            values = query_params.get(key, [])
-            return values[0] if values else default
+        # Codes are normalized here once rather than on every use
+        params = SearchParams(
+            dcity=get_param('dcity', '').upper(),
+            acity=get_param('acity', '').upper(),
+            ddate=get_param('ddate', ''),
+            rdate=get_param('rdate'),
+            triptype=get_param('triptype', 'rt').upper(),  # RT, OW, MT
+            cabin_class=get_param('class', 'y').lower(),  # y, c, f
+            quantity=int(get_param('quantity', '1')),
+            childqty=int(get_param('childqty', '0')),
+            babyqty=int(get_param('babyqty', '0')),
+            locale=locale,
+            language=locale.split('-', 1)[0],
+            curr=get_param('curr', 'IDR' if region == 'id' else 'USD'),
+            lowpricesource=get_param('lowpricesource', 'searchForm'),
+            dairport=get_param('dairport', '').upper(),
+            aairport=get_param('aairport', '').upper(),
+            pagesource=get_param('pagesource', 'list'),
+        )
         
-        params = {
-            'dcity': get_param('dcity', ''),
-            'acity': get_param('acity', ''),
-            'ddate': get_param('ddate', ''),
-            'rdate': get_param('rdate'),
-            'triptype': get_param('triptype', 'rt').upper(),  # RT, OW, MT
-            'class': get_param('class', 'y').lower(),  # y, c, f
-            'quantity': int(get_param('quantity', '1')),
-            'childqty': int(get_param('childqty', '0')),
-            'babyqty': int(get_param('babyqty', '0')),
-            'locale': get_param('locale', f'en-{region.upper()}'),
-            'curr': get_param('curr', 'IDR' if region == 'id' else 'USD'),
-            'lowpricesource': get_param('lowpricesource', 'searchForm'),
-            'dairport': get_param('dairport'),
-            'aairport': get_param('aairport'),
-            'pagesource': get_param('pagesource', 'list'),
-        }
+        origin = f"https://{hostname}"
         
-        return {
-            'url': url_string,
-            'hostname': hostname,
-            'region': region,
-            'params': params,
-        }
+        return ParsedURL(
+            url=url_string,
+            hostname=hostname,
+            region=region,
+            params=params,
+            origin=origin,
+            sse_url=f"{origin}{TRIP_SSE_ENDPOINT}",
+        )
     
     @staticmethod
-    def build_journey_info(params: Dict[str, Any]) -> list:
+    def build_journey_info(params: SearchParams) -> list:
         """
         Build journeyInfoTypes array from URL parameters.
         
@@ -74,22 +101,22 @@ class FlightSearchURLParser:
         # Outbound journey
         journey_infos.append({
             'journeyNo': 1,
-            'departDate': params['ddate'],
-            'departCode': params['dcity'].upper() if not params.get('dairport') else '',
-            'arriveCode': params['acity'].upper() if not params.get('aairport') else '',
-            'departAirport': params.get('dairport', '').upper(),
-            'arriveAirport': params.get('aairport', '').upper(),
+            'departDate': params.ddate,
+            'departCode': params.dcity if not params.dairport else '',
+            'arriveCode': params.acity if not params.aairport else '',
+            'departAirport': params.dairport,
+            'arriveAirport': params.aairport,
         })
         
         # Return journey (if round trip)
-        if params.get('rdate') and params['triptype'] == 'RT':
+        if params.rdate and params.triptype == 'RT':
             journey_infos.append({
                 'journeyNo': 2,
-                'departDate': params['rdate'],
-                'departCode': params['acity'].upper() if not params.get('aairport') else '',
-                'arriveCode': params['dcity'].upper() if not params.get('dairport') else '',
-                'departAirport': params.get('aairport', '').upper(),
-                'arriveAirport': params.get('dairport', '').upper(),
+                'departDate': params.rdate,
+                'departCode': params.acity if not params.aairport else '',
+                'arriveCode': params.dcity if not params.dairport else '',
+                'departAirport': params.aairport,
+                'arriveAirport': params.dairport,
             })
         
         return journey_infos
@@ -97,19 +124,9 @@ class FlightSearchURLParser:
     @staticmethod
     def get_trip_type_code(triptype: str) -> int:
         """Convert trip type string to code."""
-        triptype_map = {
-            'OW': 1,  # One Way
-            'RT': 2,  # Round Trip
-            'MT': 3,  # Multi-city
-        }
-        return triptype_map.get(triptype.upper(), 2)
+        return _TRIPTYPE_CODES.get(triptype.upper(), 2)
     
     @staticmethod
     def get_cabin_class_code(cabin_class: str) -> int:
         """Convert cabin class string to code."""
-        class_map = {
-            'y': 1,  # Economy
-            'c': 4,  # Business
-            'f': 8,  # First
-        }
-        return class_map.get(cabin_class.lower(), 1)
+        return _CABIN_CLASS_CODES.get(cabin_class.lower(), 1)
@@ -1,31 +1,71 @@
 """UBT (User Behavior Tracking) manager for Trip.com."""
 
+import os
 import time
 import uuid
 from typing import Dict, Any
 
+from src.models.search_models import SearchParams
+
 
 class UBTManager:
     """Manages UBT tracking IDs and generates UBT-related values."""
     
+    __slots__ = ('cookies', '_combined', '_ubt_vid', '_transaction_id', '_page_id')
+    
+    # Request head extensions in wire order; None means the entry has no value.
+    # Per-request values are filled in by build_extension_list.
+    _EXTENSION_TEMPLATE = (
+        ('source', 'ONLINE'),
+        ('sotpGroup', 'Trip'),
+        ('sotpLocale', ''),
+        ('sotpCurrency', ''),
+        ('allianceID', '0'),
+        ('sid', '0'),
+        ('ouid', ''),
+        ('uuid', None),
+        ('useDistributionType', '1'),
+        ('flt_app_session_transactionId', ''),
+        ('vid', ''),
+        ('pvid', '1'),
+        ('Flt_SessionId', '1'),
+        ('channel', None),
+        ('x-ua', 'v=3_os=ONLINE_osv=10'),
+        ('PageId', ''),
+        ('clientTime', ''),
+        ('LowPriceSource', ''),
+        ('Flt_BatchId', ''),
+        ('BlockTokenTimeout', '0'),
+        ('full_link_time_scene', 'pure_list_page'),
+        ('xproduct', 'baggage'),
+        ('units', 'METRIC'),
+        ('sotpUnit', 'METRIC'),
+    )
+    
     def __init__(self, cookies: Dict[str, Any]):
         self.cookies = cookies
+        
+        # Cookie-derived values are fixed for the session, so resolve them once
+        combined = cookies.get('_combined')
+        self._combined = combined if isinstance(combined, dict) else {}
+        self._ubt_vid = cookies['UBT_VID'] if 'UBT_VID' in cookies else self._generate_ubt_vid()
+        self._transaction_id = (
+            self._combined['transactionId'] if 'transactionId' in self._combined
+            else self._generate_transaction_id()
+        )
+        self._page_id = self._combined.get('pageId', '10320667452')
     
     def get_ubt_vid(self) -> str:
         """Get or generate UBT visitor ID."""
-        return self.cookies.get('UBT_VID', self._generate_ubt_vid())
+        return self._ubt_vid
     
     def get_transaction_id(self) -> str:
         """Get or generate transaction ID."""
-        if '_combined' in self.cookies and isinstance(self.cookies['_combined'], dict):
-            return self.cookies['_combined'].get('transactionId', self._generate_transaction_id())
-        return self._generate_transaction_id()
+        return self._transaction_id
     
     def get_page_id(self) -> str:
         """Get or generate page ID."""
-        if '_combined' in self.cookies and isinstance(self.cookies['_combined'], dict):
-            return self.cookies['_combined'].get('pageId', '10320667452')
-        return '10320667452'
+        return self._page_id
     
     def get_batch_id(self) -> str:
         """Generate Flt_BatchId (UUID format)."""
@@ -34,9 +74,8 @@ class UBTManager:
     @staticmethod
     def _generate_ubt_vid() -> str:
         """Generate UBT_VID format: timestamp.randomstring."""
-        timestamp = int(time.time() * 1000)
-        random_str = uuid.uuid4().hex[:12]
-        return f"{timestamp}.{random_str}"
+        timestamp = time.time_ns() // 1_000_000
+        return f"{timestamp}.{os.urandom(6).hex()}"
     
     @staticmethod
     def _generate_transaction_id() -> str:
@@ -44,10 +83,12 @@ class UBTManager:
         Generate transaction ID.
         Format: 1-mf-YYYYMMDDHHMMSSmmm-WEB
         """
-        from datetime import datetime
-        now = datetime.now()
-        timestamp = now.strftime('%Y%m%d%H%M%S%f')[:-3]  # YYYYMMDDHHMMSSmmm
-        return f"1-mf-{timestamp}-WEB"
+        ms = time.time_ns() // 1_000_000
+        t = time.localtime(ms // 1000)
+        return (
+            f"1-mf-{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}"
+            f"{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}{ms % 1000:03d}-WEB"
+        )
     
     def build_ubt_headers(self) -> Dict[str, str]:
         """
@@ -63,7 +104,7 @@ class UBTManager:
             'x-ctx-ubt-vid': self.get_ubt_vid(),
         }
     
-    def build_extension_list(self, params: Dict[str, Any], batch_id: str) -> list:
+    def build_extension_list(self, params: SearchParams, batch_id: str) -> list:
         """
         Build extension list for request head.
         
@@ -74,35 +115,28 @@ class UBTManager:
         Returns:
             List of extension dictionaries
         """
-        from datetime import datetime
+        # Local time in ISO format with microseconds, as datetime.now().isoformat()
+        ns = time.time_ns()
+        t = time.localtime(ns // 1_000_000_000)
+        timestamp = (
+            f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+            f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.{ns // 1000 % 1_000_000:06d}"
+        )
         
-        timestamp = datetime.now().isoformat().replace('Z', '+00:00')
+        values = {
+            'sotpLocale': params.locale,
+            'sotpCurrency': params.curr,
+            'flt_app_session_transactionId': self.get_transaction_id(),
+            'vid': self.get_ubt_vid(),
+            'PageId': self.get_page_id(),
+            'clientTime': timestamp,
+            'LowPriceSource': params.lowpricesource,
+            'Flt_BatchId': batch_id,
+        }
         
         extensions = [
-            {'name': 'source', 'value': 'ONLINE'},
-            {'name': 'sotpGroup', 'value': 'Trip'},
-            {'name': 'sotpLocale', 'value': params.get('locale', 'en-ID')},
-            {'name': 'sotpCurrency', 'value': params.get('curr', 'IDR')},
-            {'name': 'allianceID', 'value': '0'},
-            {'name': 'sid', 'value': '0'},
-            {'name': 'ouid', 'value': ''},
-            {'name': 'uuid'},
-            {'name': 'useDistributionType', 'value': '1'},
-            {'name': 'flt_app_session_transactionId', 'value': self.get_transaction_id()},
-            {'name': 'vid', 'value': self.get_ubt_vid()},
-            {'name': 'pvid', 'value': '1'},
-            {'name': 'Flt_SessionId', 'value': '1'},
-            {'name': 'channel'},
-            {'name': 'x-ua', 'value': 'v=3_os=ONLINE_osv=10'},
-            {'name': 'PageId', 'value': self.get_page_id()},
-            {'name': 'clientTime', 'value': timestamp},
-            {'name': 'LowPriceSource', 'value': params.get('lowpricesource', 'searchForm')},
-            {'name': 'Flt_BatchId', 'value': batch_id},
-            {'name': 'BlockTokenTimeout', 'value': '0'},
-            {'name': 'full_link_time_scene', 'value': 'pure_list_page'},
-            {'name': 'xproduct', 'value': 'baggage'},
-            {'name': 'units', 'value': 'METRIC'},
-            {'name': 'sotpUnit', 'value': 'METRIC'},
+            {'name': name} if value is None else {'name': name, 'value': values.get(name, value)}
+            for name, value in self._EXTENSION_TEMPLATE
         ]
         
         return extensions
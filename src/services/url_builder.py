@@ -1,10 +1,16 @@
 """URL construction service for Trip.com flight searches."""
 
-import colorama
-from urllib.parse import urlencode
+import logging
+from functools import lru_cache
+from urllib.parse import quote, urlencode
 
 from src.config import TARGET_URL
 
+logger = logging.getLogger(__name__)
+
+_TRIP_TYPES = {1: 'OW', 2: 'RT', 3: 'MT'}
+_CABIN_CLASSES = {1: 'Y', 2: 'C', 3: 'F'}
+
 
 def build_flight_url(data: dict) -> str:
     """
@@ -21,18 +27,13 @@ def build_flight_url(data: dict) -> str:
         passenger_info = search_criteria.get('passengerInfoType', {})
         journey_infos = search_criteria.get('journeyInfoTypes', [])
         
-        # Extract extensions
+        # Extensions (only LowPriceSource is needed)
         head_data = data.get('head', {})
         extensions_list = head_data.get('extension', [])
-        extensions = {ext.get('name'): ext.get('value', '') for ext in extensions_list}
         
-        # Map trip types
-        trip_type_map = {1: 'OW', 2: 'RT', 3: 'MT'}
-        trip_type = trip_type_map.get(search_criteria.get('tripType', 2), 'RT')
-        
-        # Map cabin classes
-        class_map = {1: 'Y', 2: 'C', 3: 'F'}
-        flight_class = class_map.get(search_criteria.get('realGrade', 1), 'Y')
+        # Map trip types and cabin classes
+        trip_type = _TRIP_TYPES.get(search_criteria.get('tripType', 2), 'RT')
+        flight_class = _CABIN_CLASSES.get(search_criteria.get('realGrade', 1), 'Y')
         
         # Passenger counts
         adult_count = passenger_info.get('adultCount', 1)
@@ -58,48 +59,64 @@ def build_flight_url(data: dict) -> str:
         if len(journey_infos) > 1:
             rdate = journey_infos[1].get('departDate', '')
         
-        # Low price source
-        low_price_source = extensions.get('LowPriceSource', 'searchForm')
-        
-        # Build query parameters
-        params = {
-            'pagesource': 'list',
-            'lowpricesource': low_price_source,
-            'triptype': trip_type,
-            'class': flight_class,
-            'quantity': str(adult_count),
-            'childqty': str(child_count),
-            'babyqty': str(infant_count),
-            'dcity': dcity,
-            'acity': acity,
-            'ddate': ddate,
-            'locale': 'en-ID',
-            'curr': 'IDR'
-        }
-        
-        # Add optional parameters
-        if dairport:
-            params['dairport'] = dairport
-        if aairport:
-            params['aairport'] = aairport
-        if dcity_name:
-            params['dcityName'] = dcity_name
-        if acity_name:
-            params['acityName'] = acity_name
-        if rdate:
-            params['rdate'] = rdate
-        
-        # Airline filter (empty default)
-        params['airline'] = ''
-        
-        # Build URL
-        query_string = '&'.join([f"{k}={v}" for k, v in params.items()])
-        full_url = f"{TARGET_URL}/showfarefirst?{query_string}"
+        # Low price source; scan the extensions rather than building a dict (last one wins)
+        low_price_source = 'searchForm'
+        for ext in extensions_list:
+            if ext.get('name') == 'LowPriceSource':
+                low_price_source = ext.get('value', '')
         
-        return full_url
+        # Cache keys must be hashable and must not conflate 1 / 1.0 / True, so pass the
+        # values as the strings urlencode would produce; empty optional fields stay ''
+        required = (trip_type, flight_class, adult_count, child_count, infant_count,
+                    dcity, acity, ddate, low_price_source)
+        optional = (rdate, dairport, aairport, dcity_name, acity_name)
+        return _build_url(
+            *(str(value) for value in required),
+            *(str(value) if value else '' for value in optional),
+        )
         
-    except Exception as e:
-        import traceback
-        print(f"{colorama.Fore.RED}[!] Error building URL: {e}{colorama.Fore.WHITE}")
-        print(traceback.format_exc())
+    except Exception:
+        logger.exception("Error building URL")
         raise
+
+
+@lru_cache(maxsize=512, typed=True)
+def _build_url(
+    trip_type: str, flight_class: str, adult_count: str, child_count: str, infant_count: str,
+    dcity: str, acity: str, ddate: str, low_price_source: str,
+    rdate: str, dairport: str, aairport: str, dcity_name: str, acity_name: str,
+) -> str:
+    """Build the search URL from the extracted fields; cached for repeated searches."""
+    # Build query parameters
+    params = {
+        'pagesource': 'list',
+        'lowpricesource': low_price_source,
+        'triptype': trip_type,
+        'class': flight_class,
+        'quantity': adult_count,
+        'childqty': child_count,
+        'babyqty': infant_count,
+        'dcity': dcity,
+        'acity': acity,
+        'ddate': ddate,
+        'locale': 'en-ID',
+        'curr': 'IDR'
+    }
+    
+    # Add optional parameters, skipping the empty ones
+    optional_params = {
+        'dairport': dairport,
+        'aairport': aairport,
+        'dcityName': dcity_name,
+        'acityName': acity_name,
+        'rdate': rdate,
+    }
+    params.update({k: v for k, v in optional_params.items() if v})
+    
+    # Airline filter (empty default)
+    params['airline'] = ''
+    
+    # Build URL; values are percent-encoded (e.g. spaces in city names)
+    full_url = f"{TARGET_URL}/showfarefirst?{urlencode(params, quote_via=quote)}"
+    
+    return full_url
@@ -2,12 +2,16 @@
 
 import hashlib
 import json
+import logging
 
 from src.models.w_payload_models import WPayload
 from src.config import TRIP_TYPE_MAPPING
+from src.utils import json_utils
 
+logger = logging.getLogger(__name__)
 
-def generate_w_payload(input_payload: dict) -> tuple[dict, str]:
+
+def generate_w_payload(input_payload: dict) -> tuple[WPayload, str]:
     """
     Generate W payload and its MD5 hash.
     
@@ -15,28 +19,23 @@ def generate_w_payload(input_payload: dict) -> tuple[dict, str]:
         input_payload: Request payload data
         
     Returns:
-        tuple: (w_payload_dict, w_payload_md5_hash)
+        tuple: (w_payload, w_payload_md5_hash); call `w_payload.to_dict()` if a
+        plain dictionary is needed
     """
     try:
         # Create W payload using factory method
         w_payload = WPayload.from_input_payload(input_payload, TRIP_TYPE_MAPPING)
         
-        # Convert to dictionary
-        w_payload_dict = w_payload.to_dict()
-        
-        # Debug output
-        print(f"[*] W Payload: {json.dumps(w_payload_dict, indent=2)[:500]}...")
-        
-        # Generate MD5 hash
-        w_payload_json = json.dumps(w_payload_dict, separators=(',', ':'), ensure_ascii=False)
-        w_payload_md5 = hashlib.md5(w_payload_json.encode()).hexdigest()
+        # Generate MD5 hash over the compact JSON, encoded straight from the dataclasses
+        w_payload_md5 = hashlib.md5(json_utils.dumps(w_payload)).hexdigest()
         
-        print(f"[*] W Payload MD5: {w_payload_md5}")
+        # The preview re-serializes the payload, so only build it when it is logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("W Payload: %s...", json.dumps(w_payload.to_dict(), indent=2)[:500])
+            logger.debug("W Payload MD5: %s", w_payload_md5)
         
-        return w_payload_dict, w_payload_md5
+        return w_payload, w_payload_md5
         
-    except Exception as e:
-        import traceback
-        print(f"[ERROR] W payload generation: {e}")
-        print(traceback.format_exc())
+    except Exception:
+        logger.exception("W payload generation failed")
         raise
@@ -1,11 +1,19 @@
 """X-CTX-WCLIENT-REQ header generation service."""
 
 import hashlib
+import logging
 import random
 import time
 
 from src.config import TRIP_API_ENDPOINT
 
+logger = logging.getLogger(__name__)
+
+_METHOD = 'POST'
+
+# MD5 state after the constant method + endpoint prefix of every hash input
+_HASH_PREFIX = hashlib.md5(f"{_METHOD}{TRIP_API_ENDPOINT}".encode())
+
 
 def generate_x_ctx_header(input_payload: dict) -> str:
     """
@@ -17,22 +25,21 @@ def generate_x_ctx_header(input_payload: dict) -> str:
     Returns:
         MD5 hash string for X-CTX header
     """
-    # Extract extensions
-    extensions = {
-        ext['name']: ext.get('value', '') 
-        for ext in input_payload['head']['extension']
-    }
-    
-    method = 'POST'
     timestamp = '-' + str(int(time.time() * 1000)) + "-" + str(random.randint(1000000, 9999999))
     guid = input_payload["head"].get('ClientID')
-    ubtvid = extensions.get('vid')
+    ubtvid = None
+    for ext in input_payload['head']['extension']:
+        if ext['name'] == 'vid':
+            ubtvid = ext.get('value', '')  # Last one wins, as with a dict of the extensions
     
-    # Create hash string
-    hash_input = f"{method}{TRIP_API_ENDPOINT}{timestamp}{guid}{ubtvid}"
-    md5_hash = hashlib.md5(hash_input.encode()).hexdigest()
+    # Hash the variable tail on top of the precomputed method + endpoint state
+    hash_tail = f"{timestamp}{guid}{ubtvid}"
+    md5 = _HASH_PREFIX.copy()
+    md5.update(hash_tail.encode())
+    md5_hash = md5.hexdigest()
     
-    print(f"[*] X-CTX hash input: {hash_input}")
-    print(f"[*] X-CTX hash: {md5_hash}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("X-CTX hash input: %s%s%s", _METHOD, TRIP_API_ENDPOINT, hash_tail)
+        logger.debug("X-CTX hash: %s", md5_hash)
     
     return md5_hash
@@ -1,5 +1,5 @@
 """Utility functions and helpers."""
 
-from .payload_encoder import encode_payload, simple_url_encode
+from .payload_encoder import encode, encode_payload, simple_url_encode
 
-__all__ = ['encode_payload', 'simple_url_encode']
+__all__ = ['encode', 'encode_payload', 'simple_url_encode']
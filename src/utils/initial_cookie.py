@@ -1,42 +1,49 @@
 import requests
-from http.cookiejar import CookieJar
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9,id;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+}
+
+# Shared adapter so repeated calls reuse pooled keep-alive TLS connections
+_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.1),
+)
 
 def get_initial_cookies():
     """Get initial cookies from id.trip.com"""
     
     url = "https://id.trip.com/"
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.9,id;q=0.8',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Sec-Fetch-Dest': 'document',
-        'Sec-Fetch-Mode': 'navigate',
-        'Sec-Fetch-Site': 'none',
-    }
-    
+    # Fresh session per call so cookies never carry over between calls
     session = requests.Session()
+    session.headers.update(_HEADERS)
+    session.mount("https://", _ADAPTER)
     
     try:
         print("[*] Fetching initial cookies from id.trip.com...")
-        response = session.get(url, headers=headers, timeout=10)
+        response = session.get(url, timeout=10)
         
         print(f"[+] Status Code: {response.status_code}")
         print(f"[+] Cookies received: {len(session.cookies)} cookies\n")
 
         new_url = "https://id.trip.com/flights/showfarefirst?dcity=jkt&acity=pku&ddate=2026-01-25&rdate=2026-01-27&triptype=rt&class=y&lowpricesource=searchform&quantity=1&searchboxarg=t&nonstoponly=off&locale=en-ID&curr=IDR" 
         print("[*] Accessing flight search page to get additional cookies...")
-        response2 = session.get(new_url, headers=headers, timeout=10)
+        response2 = session.get(new_url, timeout=10)
         print(f"[+] Status Code: {response2.status_code}")
         
-        # Display all cookies
-        cookies_dict = {}
-        for cookie in session.cookies:
-            cookies_dict[cookie.name] = cookie.value
-            print(f"  {cookie.name}: {cookie.value}")
+        cookies_dict = {cookie.name: cookie.value for cookie in session.cookies}
         
         # Format for request headers
         cookie_string = '; '.join([f"{k}={v}" for k, v in cookies_dict.items()])
@@ -0,0 +1,38 @@
+"""
+JSON encoding and decoding helpers, backed by orjson when it is installed.
+
+`dumps` serializes dataclasses directly (orjson does so natively); the stdlib
+fallback goes through the object's `to_dict()`. Output is compact and UTF-8,
+byte-for-byte what `json.dumps(..., separators=(',', ':'), ensure_ascii=False)`
+produces for the payloads used here.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
+
+
+if orjson is not None:
+    JSONDecodeError = orjson.JSONDecodeError
+    loads = orjson.loads
+
+    def dumps(obj) -> bytes:
+        """Serialize `obj` to compact UTF-8 encoded JSON."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+else:
+    JSONDecodeError = json.JSONDecodeError
+    loads = json.loads
+
+    def _default(obj):
+        to_dict = getattr(obj, 'to_dict', None)
+        if to_dict is None:
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+        return to_dict()
+
+    def dumps(obj) -> bytes:
+        """Serialize `obj` to compact UTF-8 encoded JSON."""
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=_default).encode()
@@ -6,160 +6,162 @@ import urllib.parse
 from src.models.payload_models import PayloadData
 
 
-def encode_payload():
+# Size of the compressor's sliding window and of each processed chunk
+_WINDOW_SIZE = 16384
+
+# Output alphabet; the compressor emits 6-bit indices into it
+_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+_SYMBOL_TABLE = _ALPHABET + bytes(256 - len(_ALPHABET))
+
+
+def _put_byte(out, n, l, c, byte):
+    """Append one byte to the 6-bit output stream; returns the new (n, l, c)."""
+    t = l << (6 - c)
+    l = 255 & byte
+    c += 2
+    t |= l >> c
+    out[n] = 63 & t
+    n += 1
+    if c >= 6:
+        c -= 6
+        out[n] = 63 & (l >> c)
+        n += 1
+    return n, l, c
+
+
+def _put_literals(data, out, n, l, c, start, end):
+    """Emit data[start:end] as literal runs of at most 127 bytes."""
+    pos = start
+    while pos < end:
+        run = min(127, end - pos)
+        n, l, c = _put_byte(out, n, l, c, 255 & -run)
+        for idx in range(pos, pos + run):
+            n, l, c = _put_byte(out, n, l, c, data[idx])
+        pos += 127
+    return n, l, c
+
+
+def _compress(data, hash_table, chain, out):
     """
-    Create a payload encoder function using Trip.com's compression algorithm.
+    Trip.com's LZ77-style compressor.
     
+    Args:
+        data: Input bytes
+        hash_table: Zeroed buffer of _WINDOW_SIZE ints (last position + 1 per hash)
+        chain: Buffer of _WINDOW_SIZE ints (previous position per chunk offset)
+        out: Output buffer, at least 2 * len(data) + 16 long
+        
     Returns:
-        Function that encodes payload strings
+        Number of 6-bit symbols written to `out`
     """
-    e = 16384
-    t = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+    size = len(data)
+    n = 0  # Symbols written
+    l = 0  # Last byte fed to the bit packer
+    c = 0  # Bits of `l` not yet written
+    s = -1  # Start of the pending literal run
+    o = 0  # End of the last match
+    a = 0  # Current position
+    
+    n, l, c = _put_byte(out, n, l, c, 19)
     
-    def encoder(i):
-        # Convert string to bytes (UTF-8 encoded)
-        encoded = i.encode('utf-8')
-        n = list(encoded)
+    u = 0
+    while u < size and a < size:
+        chunk_end = min(u + _WINDOW_SIZE, size)
+        l_limit = min(chunk_end, size - 2)
         
-        def compress(i):
-            # Initialize variables
-            hash_table = []
-            r = []
-            s = -1
-            o = 0
-            a = 0
-            l = 0
-            c = 0
-            d = []
-            
-            def get_min(x, y):
-                return min(x, y)
+        while a < chunk_end:
+            match_len = 0
+            match_offset = 0
             
-            def calculate_hash():
-                nonlocal a
-                hash_val = 0
-                for idx in range(a, min(a + 3, len(i))):
-                    hash_val *= 16777619
-                    hash_val ^= i[idx]
-                return hash_val & 16383
-            
-            def find_match_length(pos):
-                nonlocal a
-                r_limit = get_min(pos + 130, a)
-                t_idx = pos
-                n_idx = a
-                while t_idx < r_limit and n_idx < len(i) and i[t_idx] == i[n_idx]:
-                    t_idx += 1
-                    n_idx += 1
-                return t_idx - pos
-            
-            def encode_literals():
-                nonlocal s, a
-                e_pos = s
-                while e_pos < a:
-                    chunk_size = get_min(127, a - e_pos)
-                    encode_byte(255 & -chunk_size)
-                    for n in range(e_pos, min(a, e_pos + chunk_size)):
-                        encode_byte(i[n])
-                    e_pos += 127
-            
-            def encode_byte(byte):
-                nonlocal l, c
-                t = l << (6 - c)
-                l = 255 & byte
-                c += 2
-                t |= l >> c
-                write_char(63 & t)
-                if c >= 6:
-                    c -= 6
-                    t = l >> c
-                    write_char(63 & t)
-            
-            def write_char(idx):
-                d.append(t[idx])
-            
-            def process_chunk():
-                nonlocal a, o, s
-                chunk_end = get_min(u + 16384, len(i))
-                l_limit = get_min(chunk_end, len(i) - 3 + 1)
+            if a < l_limit:
+                hash_val = ((((data[a] * 16777619) ^ data[a + 1]) * 16777619) ^ data[a + 2]) & 16383
                 
-                while a < chunk_end:
-                    match_len = 0
-                    match_offset = 0
+                if a >= o:
+                    pos = hash_table[hash_val] - 1
                     
-                    if a < l_limit:
-                        hash_val = calculate_hash()
-                        
-                        if a >= o:
-                            # Initialize hash_table and r if needed
-                            while len(hash_table) <= hash_val:
-                                hash_table.append(0)
-                            
-                            pos = hash_table[hash_val] - 1
-                            
-                            while match_len != 130 and pos >= 0 and pos >= a - e:
-                                length = find_match_length(pos)
-                                if length >= 3 and length > match_len:
-                                    match_len = length
-                                    match_offset = a - pos - match_len
-                                
-                                if pos >= u and pos - u < len(r):
-                                    pos = r[pos - u]
-                                else:
-                                    break
-                        
-                        # Update hash table
-                        while len(hash_table) <= hash_val:
-                            hash_table.append(0)
+                    while match_len != 130 and pos >= 0 and pos >= a - _WINDOW_SIZE:
+                        # Length of the match between pos and a
+                        limit = min(pos + 130, a)
+                        t_idx = pos
+                        n_idx = a
+                        while t_idx < limit and n_idx < size and data[t_idx] == data[n_idx]:
+                            t_idx += 1
+                            n_idx += 1
+                        length = t_idx - pos
                         
-                        if a >= u:
-                            while len(r) <= a - u:
-                                r.append(-1)
-                            r[a - u] = hash_table[hash_val] - 1
+                        if length >= 3 and length > match_len:
+                            match_len = length
+                            match_offset = a - pos - match_len
                         
-                        hash_table[hash_val] = a + 1
-                    
-                    if match_len >= 3:
-                        o = a + match_len
-                        if s != -1:
-                            encode_literals()
-                            s = -1
-                        
-                        encode_byte(match_len - 3)
-                        
-                        while match_offset > 127:
-                            encode_byte((127 & match_offset) | 128)
-                            match_offset >>= 7
-                        encode_byte(match_offset)
-                    else:
-                        if a >= o and s == -1:
-                            s = a
-                    
-                    a += 1
-            
-            # Main compression logic
-            encode_byte(19)
-            
-            u = 0
-            while u < len(i) and a < len(i):
-                if u > 0:
-                    r = r[e:]
-                process_chunk()
-                u += e
-            
-            if s != -1:
-                encode_literals()
+                        # Chains only link positions inside the current chunk
+                        if pos >= u:
+                            pos = chain[pos - u]
+                        else:
+                            break
+                
+                chain[a - u] = hash_table[hash_val] - 1
+                hash_table[hash_val] = a + 1
             
-            if c == 2:
-                write_char((l << 4) & 63)
-            elif c == 4:
-                write_char((l << 2) & 63)
+            if match_len >= 3:
+                o = a + match_len
+                if s != -1:
+                    n, l, c = _put_literals(data, out, n, l, c, s, a)
+                    s = -1
+                
+                n, l, c = _put_byte(out, n, l, c, match_len - 3)
+                
+                while match_offset > 127:
+                    n, l, c = _put_byte(out, n, l, c, (127 & match_offset) | 128)
+                    match_offset >>= 7
+                n, l, c = _put_byte(out, n, l, c, match_offset)
+            else:
+                if a >= o and s == -1:
+                    s = a
             
-            return ''.join(d)
+            a += 1
+        
+        u += _WINDOW_SIZE
+    
+    if s != -1:
+        n, l, c = _put_literals(data, out, n, l, c, s, a)
+    
+    if c == 2:
+        out[n] = (l << 4) & 63
+        n += 1
+    elif c == 4:
+        out[n] = (l << 2) & 63
+        n += 1
+    
+    return n
+
+
+def encode(payload: str) -> str:
+    """
+    Encode a payload string using Trip.com's compression algorithm.
+    
+    Args:
+        payload: Payload string (usually compact JSON)
         
-        return compress(n)
+    Returns:
+        Compressed payload in Trip.com's 64-character alphabet
+    """
+    data = payload.encode('utf-8')
+    out = bytearray(2 * len(data) + 16)
+    n = _compress(data, [0] * _WINDOW_SIZE, [-1] * _WINDOW_SIZE, out)
     
-    return encoder
+    return out[:n].translate(_SYMBOL_TABLE).decode('ascii')
+
+
+def encode_payload():
+    """
+    Create a payload encoder function using Trip.com's compression algorithm.
+    
+    Kept for existing callers; use `encode` directly.
+    
+    Returns:
+        Function that encodes payload strings
+    """
+    return encode
 
 
 def simple_url_encode(payload_dict: dict) -> str:
@@ -178,8 +180,6 @@ def simple_url_encode(payload_dict: dict) -> str:
 
 if __name__ == "__main__":
     # Example usage
-    encode_payload_func = encode_payload()
-    
     payload = PayloadData.create_flight_payload(
         dcity="JKT",
         acity="SIN",
@@ -193,6 +193,6 @@ if __name__ == "__main__":
     )
     
     payload_dict = payload.to_dict()
-    encoded = encode_payload_func(json.dumps(payload_dict, separators=(',', ':'), ensure_ascii=False))
+    encoded = encode(json.dumps(payload_dict, separators=(',', ':'), ensure_ascii=False))
     result = f"d={encoded}&ac=b"
     print(result)
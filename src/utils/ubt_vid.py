@@ -2,13 +2,17 @@ import time
 import random
 import string
 
+# Alphanumeric alphabet for the random part of the ID
+_ALPHABET = string.ascii_letters + string.digits
+
 def generate_ubtvid():
-   timestamp = int(time.time() * 1000)
-   random_id = ''.join(random.choices(string.ascii_letters + string.digits, k=12))
+   timestamp = time.time_ns() // 1_000_000
+   random_id = ''.join(random.choices(_ALPHABET, k=12))
    return f"{timestamp}.{random_id}"
 
 def main():
     ubtvid_info = generate_ubtvid()
     print(ubtvid_info)
 
-main()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,10 @@
 import hashlib
 import json
+import logging
 from models.w_payload_models import WPayload
 
+logger = logging.getLogger(__name__)
+
 # Trip type mapping
 TRIP_TYPE_MAPPING = {
     1: 'OW',  # One Way
@@ -26,19 +29,16 @@ def get_result(input_payload):
         # Convert to dictionary
         payload_dict = w_payload.to_dict()
         
-        # Debug output
-        print(f"W Payload: {json.dumps(payload_dict, indent=2)[:500]}...")
-        
-        # Generate MD5 hash
+        # Generate MD5 hash; json.dumps escapes non-ASCII, so encode as ASCII
         md5_hash = hashlib.md5(
-            json.dumps(payload_dict, separators=(',', ':')).encode()
+            json.dumps(payload_dict, separators=(',', ':')).encode('ascii')
         ).hexdigest()
         
-        print(f"W Payload MD5: {md5_hash}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("W Payload: %s...", json.dumps(payload_dict, indent=2)[:500])
+            logger.debug("W Payload MD5: %s", md5_hash)
         return payload_dict, md5_hash
         
-    except Exception as e:
-        import traceback
-        print(f"[ERROR] w_payload_source: {e}")
-        print(traceback.format_exc())
+    except Exception:
+        logger.exception("w_payload_source failed")
         return None, None
\ No newline at end of file
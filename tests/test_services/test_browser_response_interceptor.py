@@ -0,0 +1,81 @@
+"""Tests for incremental SSE parsing in BrowserResponseInterceptor."""
+
+from src.services.browser_response_interceptor import BrowserResponseInterceptor
+
+
+URL = "https://id.trip.com/restapi/soa2/27015/FlightListSearchSSE"
+
+# Mixed LF / CRLF line endings, multibyte text, event/id fields and a non-JSON payload
+SSE_BODY = (
+    'event: search\nid: 1\ndata: {"basicInfo": {"city": "Jakarta → Singapura"}}\n\n'
+    'data: {"flightList": [{"airline": "東京航空", "price": 1250000}]}\r\n\r\n'
+    'id: 3\r\ndata: not json — ünïcödé\r\n\r\n'
+    'data: {"itineraryList": [{"note": "a b"}], "done": true}\n\n'
+).encode('utf-8')
+
+
+def _response(body: bytes, url: str = URL) -> dict:
+    return {'body': body, 'url': url, 'status': 200, 'timestamp': 1}
+
+
+def _one_shot(body: bytes, url: str = URL) -> dict:
+    """Parse `body` with a fresh interceptor, i.e. without any incremental state."""
+    return BrowserResponseInterceptor(None)._parse_response(_response(body, url))
+
+
+def _cut_points(body: bytes) -> list:
+    """Offsets at every line end, mid-line and inside a multibyte character."""
+    cuts = set(range(1, len(body), 7))
+    for i, byte in enumerate(body):
+        if byte in b'\r\n':
+            cuts.update((i, i + 1))
+        elif byte >= 0x80:
+            cuts.add(i + 1)
+    cuts.add(len(body))
+    return sorted(cut for cut in cuts if 0 < cut <= len(body))
+
+
+def test_incremental_parse_matches_one_shot_parse():
+    interceptor = BrowserResponseInterceptor(None)
+
+    for cut in _cut_points(SSE_BODY):
+        result = interceptor._parse_response(_response(SSE_BODY[:cut]))
+        assert result == _one_shot(SSE_BODY[:cut]), cut
+
+    assert result['eventCount'] == 4
+    assert result['events'][0] == {'basicInfo': {'city': 'Jakarta → Singapura'}}
+    assert result['events'][2] == 'not json — ünïcödé'
+
+
+def test_incremental_parse_with_growing_chunks():
+    interceptor = BrowserResponseInterceptor(None)
+
+    for cut in (5, 40, 41, 90, 160, len(SSE_BODY) - 3, len(SSE_BODY)):
+        result = interceptor._parse_response(_response(SSE_BODY[:cut]))
+        assert result == _one_shot(SSE_BODY[:cut]), cut
+
+
+def test_changed_url_falls_back_to_full_parse():
+    first = b'data: {"from": "A"}\n' + SSE_BODY
+    second = b'data: {"from": "B"}\n' + SSE_BODY
+    cut = len(first) // 2
+    interceptor = BrowserResponseInterceptor(None)
+    interceptor._parse_response(_response(first[:cut]))
+
+    other_url = URL + "?retry=1"
+    result = interceptor._parse_response(_response(second, other_url))
+
+    assert result == _one_shot(second, other_url)
+    assert result['events'][0] == {'from': 'B'}
+
+
+def test_changed_prefix_falls_back_to_full_parse():
+    first = SSE_BODY + b'data: {"seq": 1}\n\n'
+    second = SSE_BODY + b'data: {"seq": 2}\n\ndata: {"seq": 3}\n'
+    interceptor = BrowserResponseInterceptor(None)
+    interceptor._parse_response(_response(first))
+
+    result = interceptor._parse_response(_response(second))
+
+    assert result == _one_shot(second)
+    assert result['events'][-2:] == [{'seq': 2}, {'seq': 3}]